@@ -0,0 +1,278 @@
+"""Shared prompt formatting and reply parsing for the example agents.
+
+Used by openai_agent.py, anthropic_agent.py, and local_llm_agent.py:
+
+    from _common import (
+        SYSTEM_PROMPT, format_observation, parse_action, trim_history,
+    )
+
+    prompt = format_observation(obs)   # observation -> LLM prompt text
+    action = parse_action(reply)       # LLM reply -> Action (Wait on failure)
+    trim_history(messages, keep=1)     # drop the oldest turns past the window
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import re
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import ValidationError
+
+from crawlerverse import Action, Observation, VisibleTile, Wait
+from crawlerverse import parse_action as validate_action
+
+log = logging.getLogger("crawlerverse")
+
+SYSTEM_PROMPT = """\
+You are an AI agent playing Crawler, a roguelike dungeon game.
+
+Each turn you receive an observation and must choose ONE action.
+Respond with a JSON object (no markdown, no explanation).
+
+## Actions
+
+Movement:
+  {"action": "move", "direction": "<dir>"}
+  {"action": "attack", "direction": "<dir>"}
+  {"action": "ranged_attack", "direction": "<dir>", "distance": <1-15>}
+
+Items:
+  {"action": "pickup"}
+  {"action": "drop", "itemType": "<item>"}
+  {"action": "use", "itemType": "<item>"}
+  {"action": "equip", "itemType": "<item>"}
+
+Other:
+  {"action": "wait"}
+  {"action": "enter_portal"}
+
+Directions: north, south, east, west, northeast, northwest, southeast, southwest
+
+## Strategy Tips
+- Kill monsters to clear the path. Attack adjacent monsters.
+- Pick up items (potions, weapons, armor) — they help you survive.
+- Equip weapons and armor for better stats.
+- Use health potions when HP is low.
+- Find stairs down to descend to the next floor.
+- Explore systematically; avoid getting surrounded.
+
+Always include a "reasoning" field explaining your decision.\
+"""
+
+# Number of user/assistant turn pairs the agents resend each request. Older
+# turns are dropped so the prompt stays bounded instead of growing every turn.
+HISTORY_TURNS = 6
+
+# Observation fields that identify a game state for ActionCache. The turn
+# counter and message log change every turn without changing the situation.
+_FINGERPRINT_FIELDS = {"floor", "player", "inventory", "visible_tiles"}
+
+# Outermost {...} in the reply: skips markdown fences and surrounding prose
+# in one scan.
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Actions are frozen, so every unparseable reply can share one fallback.
+_PARSE_FAILED = Wait(reasoning="Failed to parse response")
+
+
+def _format_tile(tile: VisibleTile) -> str:
+    """One "Visible tiles" line, including its leading newline."""
+    m = tile.monster
+    items = tile.items
+    return (
+        f"\n  ({tile.x},{tile.y}) {tile.type.value}"
+        + (f" [MONSTER: {m.type} HP:{m.hp}/{m.max_hp}]" if m else "")
+        + (f" [ITEMS: {', '.join(items)}]" if items else "")
+    )
+
+
+def format_observation(obs: Observation) -> str:
+    """Format observation into a detailed prompt for the LLM."""
+    p = obs.player
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        f"Turn {obs.turn} | Floor {obs.floor}\n"
+        f"HP: {p.hp}/{p.max_hp} | ATK: {p.attack} | DEF: {p.defense}\n"
+        f"Position: ({p.position[0]}, {p.position[1]})"
+    )
+
+    if p.equipped_weapon:
+        w(f"\nWeapon: {p.equipped_weapon}")
+    if p.equipped_armor:
+        w(f"\nArmor: {p.equipped_armor}")
+
+    if obs.inventory:
+        inv = ", ".join([f"{i.name} ({i.type})" for i in obs.inventory])
+        w(f"\nInventory: {inv}")
+
+    passable = [d.value for d in obs.passable_directions()]
+    w(f"\nPassable directions: {', '.join(passable) if passable else 'none'}")
+
+    w("\n\nVisible tiles:")
+    w("".join([_format_tile(tile) for tile in obs.visible_tiles]))
+
+    if obs.messages:
+        w("\n\nMessages:")
+        for msg in obs.messages:
+            w(f"\n  {msg}")
+
+    return buf.getvalue()
+
+
+def parse_action(raw: str) -> Action:
+    """Parse LLM response into an Action, with fallback to Wait."""
+    if raw[:1] == "{" and raw[-1:] == "}":
+        # Already a bare object (e.g. the Anthropic prefill): skip the scan.
+        text = raw
+    else:
+        match = _JSON_OBJECT_RE.search(raw)
+        text = match.group(0) if match else raw.strip()
+
+    # One pydantic-core call decodes the JSON, dispatches on "action",
+    # resolves camelCase aliases (itemType) and ignores unknown keys.
+    try:
+        return validate_action(text)
+    except ValidationError as e:
+        log.warning(
+            "Invalid action in LLM response: %s (%s)",
+            text[:100],
+            e.errors()[0]["msg"],
+        )
+        return _PARSE_FAILED
+
+
+class JsonReplyBuffer:
+    """Accumulates streamed reply text until the first JSON object closes.
+
+    ``feed`` returns True once the top-level object is complete, so the
+    caller can stop reading instead of waiting for trailing tokens. Braces
+    inside JSON strings are ignored, so a ``}`` in the reasoning text
+    doesn't end the object early.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """Append ``chunk``; return True once the JSON object has closed."""
+        self._parts.append(chunk)
+        depth = self._depth
+        in_string = self._in_string
+        escaped = self._escaped
+        done = False
+        for ch in chunk:
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = depth > 0
+            elif ch == "{":
+                depth += 1
+            elif ch == "}" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    done = True
+                    break
+        self._depth = depth
+        self._in_string = in_string
+        self._escaped = escaped
+        return done
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+
+class ActionJSON:
+    """Log argument that serializes an action only if the record is emitted.
+
+        log.info("Turn %d: %s", obs.turn, ActionJSON(action))
+    """
+
+    __slots__ = ("action",)
+
+    def __init__(self, action: Action) -> None:
+        self.action = action
+
+    def __str__(self) -> str:
+        return self.action.model_dump_json(by_alias=True)
+
+
+def trim_history(
+    messages: list[dict[str, Any]],
+    *,
+    max_turns: int = HISTORY_TURNS,
+    keep: int = 0,
+    trim_to: int | None = None,
+) -> None:
+    """Drop the oldest turns in place so at most ``max_turns`` pairs remain.
+
+    The first ``keep`` messages (e.g. the system prompt) are never removed.
+    Whole user/assistant pairs are dropped, so the history still starts on
+    a user turn. With ``trim_to``, an overflowing history is cut back to
+    ``trim_to`` pairs at once, so the prefix stays unchanged (and prompt
+    cacheable) for several turns instead of shifting every turn.
+    """
+    if trim_to is not None and trim_to > max_turns:
+        msg = f"trim_to ({trim_to}) must not exceed max_turns ({max_turns})"
+        raise ValueError(msg)
+    excess = len(messages) - keep - 2 * max_turns
+    if excess > 0:
+        if trim_to is not None:
+            excess = len(messages) - keep - 2 * trim_to
+        del messages[keep : keep + excess + (excess & 1)]
+
+
+class ActionCache:
+    """LRU of previously chosen actions keyed by an observation fingerprint.
+
+    Lets an agent skip the LLM call when it revisits a state it has already
+    decided on. A state that is unchanged since the previous turn is never
+    served from the cache: the last action evidently had no effect, so
+    repeating it would loop forever.
+
+        cached = cache.lookup(obs)
+        if cached is not None:
+            return cached
+        ...
+        cache.store(action)
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, Action] = OrderedDict()
+        self._last_key: bytes | None = None
+
+    def lookup(self, obs: Observation) -> Action | None:
+        """Return the cached action for ``obs``, or None on a miss."""
+        state = obs.model_dump_json(include=_FINGERPRINT_FIELDS).encode()
+        key = hashlib.blake2b(state, digest_size=16).digest()
+        stale = key == self._last_key
+        self._last_key = key
+        if stale:
+            return None
+        action = self._entries.get(key)
+        if action is not None:
+            self._entries.move_to_end(key)
+        return action
+
+    def store(self, action: Action) -> None:
+        """Cache ``action`` for the observation last passed to lookup()."""
+        if self._last_key is None:
+            return
+        self._entries[self._last_key] = action
+        self._entries.move_to_end(self._last_key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
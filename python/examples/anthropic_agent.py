@@ -11,33 +11,36 @@ Usage:
     # Enable debug diagnostics (local map, move validation):
     CRAWLERVERSE_DEBUG=1 python examples/anthropic_agent.py
 
+    # Reuse earlier decisions for repeated states (skips the LLM call):
+    ACTION_CACHE_SIZE=256 python examples/anthropic_agent.py
+
 Requirements (not included in crawlerverse):
     pip install anthropic
 """
 
 from __future__ import annotations
 
-import json
 import logging
 import os
-
+from typing import Any
+
+from _common import (
+    HISTORY_TURNS,
+    SYSTEM_PROMPT,
+    ActionCache,
+    ActionJSON,
+    format_observation,
+    parse_action,
+    trim_history,
+)
 from anthropic import Anthropic
 from diagnostics import create_debug_callback
 
 from crawlerverse import (
     Action,
-    Attack,
+    CompletedOutcome,
     CrawlerClient,
-    Direction,
-    Drop,
-    EnterPortal,
-    Equip,
-    Move,
     Observation,
-    Pickup,
-    RangedAttack,
-    Use,
-    Wait,
     run_game,
 )
 
@@ -45,159 +48,73 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 log = logging.getLogger("crawlerverse")
 log.setLevel(logging.DEBUG)
 
-SYSTEM_PROMPT = """\
-You are an AI agent playing Crawler, a roguelike dungeon game.
-Each turn you receive an observation and must choose ONE action.
-Respond with a JSON object (no markdown, no explanation).
-
-## Actions
-  {"action": "move", "direction": "<dir>"}
-  {"action": "attack", "direction": "<dir>"}
-  {"action": "ranged_attack", "direction": "<dir>", "distance": <1-15>}
-  {"action": "pickup"}
-  {"action": "drop", "itemType": "<item>"}
-  {"action": "use", "itemType": "<item>"}
-  {"action": "equip", "itemType": "<item>"}
-  {"action": "wait"}
-  {"action": "enter_portal"}
-
-Directions: north, south, east, west, northeast, northwest, southeast, southwest
-
-## Strategy Tips
-- Kill monsters to clear the path. Attack adjacent monsters.
-- Pick up items (potions, weapons, armor) — they help you survive.
-- Equip weapons and armor for better stats.
-- Use health potions when HP is low.
-- Find stairs down to descend to the next floor.
-- Explore systematically; avoid getting surrounded.
-
-Always include a "reasoning" field explaining your decision."""
-
-ACTION_MAP: dict[str, type[Action]] = {
-    "move": Move,
-    "attack": Attack,
-    "wait": Wait,
-    "pickup": Pickup,
-    "drop": Drop,
-    "use": Use,
-    "equip": Equip,
-    "enter_portal": EnterPortal,
-    "ranged_attack": RangedAttack,
-}
-
-
-def format_observation(obs: Observation) -> str:
-    """Format observation into a detailed prompt for Claude."""
-    p = obs.player
-    lines = [
-        f"Turn {obs.turn} | Floor {obs.floor}",
-        f"HP: {p.hp}/{p.max_hp} | ATK: {p.attack} | DEF: {p.defense}",
-        f"Position: ({p.position[0]}, {p.position[1]})",
-    ]
-
-    if p.equipped_weapon:
-        lines.append(f"Weapon: {p.equipped_weapon}")
-    if p.equipped_armor:
-        lines.append(f"Armor: {p.equipped_armor}")
-
-    if obs.inventory:
-        inv = ", ".join(f"{i.name} ({i.type})" for i in obs.inventory)
-        lines.append(f"Inventory: {inv}")
-
-    passable = [d.value for d in Direction if obs.can_move(d)]
-    lines.append(f"Passable directions: {', '.join(passable) if passable else 'none'}")
-
-    lines.append("")
-    lines.append("Visible tiles:")
-    for tile in obs.visible_tiles:
-        parts = [f"  ({tile.x},{tile.y}) {tile.type}"]
-        if tile.monster:
-            m = tile.monster
-            parts.append(f"[MONSTER: {m.type} HP:{m.hp}/{m.max_hp}]")
-        if tile.items:
-            parts.append(f"[ITEMS: {', '.join(tile.items)}]")
-        lines.append(" ".join(parts))
-
-    if obs.messages:
-        lines.append("")
-        lines.append("Messages:")
-        for msg in obs.messages:
-            lines.append(f"  {msg}")
-
-    return "\n".join(lines)
-
-
-def parse_action(raw: str) -> Action:
-    """Parse Claude's response into an Action, with fallback to Wait."""
-    text = raw.strip()
-    if text.startswith("```"):
-        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-    if text.endswith("```"):
-        text = text[:-3]
-    text = text.strip()
-
-    # Extract JSON if surrounded by other text
-    if not text.startswith("{"):
-        start = text.find("{")
-        if start >= 0:
-            end = text.rfind("}")
-            if end > start:
-                text = text[start : end + 1]
-
-    try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        log.warning("Failed to parse Claude response as JSON: %s", text[:100])
-        return Wait(reasoning="Failed to parse response")
-
-    action_type = data.get("action", "wait")
-    cls = ACTION_MAP.get(action_type)
-    if cls is None:
-        log.warning("Unknown action type: %s", action_type)
-        return Wait(reasoning=f"Unknown action: {action_type}")
-
-    # Build kwargs from the response, filtering to known fields
-    valid_fields = set(cls.model_fields.keys())
-    kwargs = {}
-    for k, v in data.items():
-        if k != "action" and k in valid_fields:
-            kwargs[k] = v
-
-    # Handle camelCase -> snake_case for itemType
-    if "itemType" in data and "item_type" in valid_fields:
-        kwargs["item_type"] = data["itemType"]
-
-    try:
-        return cls(**kwargs)
-    except Exception as e:
-        log.warning("Failed to construct %s: %s", action_type, e)
-        return Wait(reasoning=f"Failed to construct {action_type}")
-
-
-def make_agent(model: str = "claude-haiku-4-5-20251001"):
-    """Create an agent function that uses Anthropic Claude to decide actions."""
-    client = Anthropic()
-    messages: list[dict[str, str]] = []
+# Prompt caching: the system prompt and the conversation up to the newest
+# user turn form a prefix that only grows between history trims, so marking
+# it ephemeral lets the API bill and process only the uncached suffix on the
+# next turn.
+_CACHE_CONTROL = {"type": "ephemeral"}
+_SYSTEM = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": _CACHE_CONTROL}]
+
+# Prefill assistant turn with "{" to force JSON output
+_PREFILL = {"role": "assistant", "content": "{"}
+
+
+def make_agent(
+    model: str = "claude-haiku-4-5-20251001",
+    cache_size: int = 0,
+    max_history_turns: int = HISTORY_TURNS,
+):
+    """Create an agent function that uses Anthropic Claude to decide actions.
+
+    At most ``max_history_turns`` user/assistant pairs are resent each turn.
+    When the window fills it is cut back to half in one step rather than by
+    one pair per turn: dropping a pair every turn would change the prompt
+    prefix each time and defeat prompt caching, so the window trades a
+    slightly longer average history for cache hits between trims. With
+    ``cache_size`` > 0, actions are cached per game state (see
+    ``ActionCache``) and repeated states skip the LLM call.
+    """
+    create = Anthropic().messages.create
+    cache = ActionCache(cache_size) if cache_size > 0 else None
+    messages: list[dict[str, Any]] = []
 
     def agent(obs: Observation) -> Action:
-        prompt = format_observation(obs)
-        messages.append({"role": "user", "content": prompt})
+        if cache is not None:
+            cached = cache.lookup(obs)
+            if cached is not None:
+                log.info("Turn %d: %s (cached)", obs.turn, ActionJSON(cached))
+                return cached
 
-        # Prefill assistant turn with "{" to force JSON output
-        prefill = {"role": "assistant", "content": "{"}
-        response = client.messages.create(
+        prompt = format_observation(obs)
+        # Only the newest user turn carries a cache breakpoint; the stored
+        # history stays plain so breakpoints don't pile up across turns.
+        latest = {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": prompt, "cache_control": _CACHE_CONTROL}
+            ],
+        }
+        response = create(
             model=model,
-            system=SYSTEM_PROMPT,
-            messages=[*messages, prefill],
+            system=_SYSTEM,
+            messages=[*messages, latest, _PREFILL],
             temperature=0.3,
             max_tokens=200,
         )
 
         reply = "{" + response.content[0].text
+        messages.append({"role": "user", "content": prompt})
         messages.append({"role": "assistant", "content": reply})
+        trim_history(
+            messages,
+            max_turns=max_history_turns,
+            trim_to=max_history_turns // 2,
+        )
 
         action = parse_action(reply)
-        log.info("Turn %d: %s", obs.turn, action.model_dump_json(by_alias=True))
+        if cache is not None:
+            cache.store(action)
+        log.info("Turn %d: %s", obs.turn, ActionJSON(action))
         return action
 
     return agent
@@ -215,7 +132,8 @@ def main():
         print(f"Starting game with model: {model} (leaderboard ID: {model_id})")
     print()
 
-    agent = make_agent(model=model)
+    cache_size = int(os.environ.get("ACTION_CACHE_SIZE", "0"))
+    agent = make_agent(model=model, cache_size=cache_size)
 
     base_url = os.environ.get(
         "CRAWLERVERSE_BASE_URL", "https://www.crawlerver.se/api/agent"
@@ -235,7 +153,7 @@ def main():
     print(f"Game over! {outcome.status}")
     print(f"  Floor reached: {outcome.floor}")
     print(f"  Total turns: {outcome.turns}")
-    if hasattr(outcome, "result"):
+    if isinstance(outcome, CompletedOutcome):
         print(f"  Result: {outcome.result}")
     print(f"  Watch replay: {result.spectator_url}")
 
@@ -33,29 +33,33 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING
 
+from crawlerverse import Direction, Move, TileType
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from crawlerverse import Action, Observation
 
-_DIRECTION_OFFSETS: dict[str, tuple[int, int]] = {
-    "north": (0, -1),
-    "south": (0, 1),
-    "east": (1, 0),
-    "west": (-1, 0),
-    "northeast": (1, -1),
-    "northwest": (-1, -1),
-    "southeast": (1, 1),
-    "southwest": (-1, 1),
+# Keyed by Direction members: every direction is present, so lookups index
+# directly instead of falling back to a default.
+_DIRECTION_OFFSETS: dict[Direction, tuple[int, int]] = {
+    Direction.NORTH: (0, -1),
+    Direction.SOUTH: (0, 1),
+    Direction.EAST: (1, 0),
+    Direction.WEST: (-1, 0),
+    Direction.NORTHEAST: (1, -1),
+    Direction.NORTHWEST: (-1, -1),
+    Direction.SOUTHEAST: (1, 1),
+    Direction.SOUTHWEST: (-1, 1),
 }
 
-_TILE_CHARS: dict[str, str] = {
-    "wall": "#",
-    "floor": ".",
-    "door": "+",
-    "stairs_down": ">",
-    "stairs_up": "<",
-    "portal": "%",
+_TILE_CHARS: dict[TileType, str] = {
+    TileType.WALL: "#",
+    TileType.FLOOR: ".",
+    TileType.DOOR: "+",
+    TileType.STAIRS_DOWN: ">",
+    TileType.STAIRS_UP: "<",
+    TileType.PORTAL: "%",
 }
 
 
@@ -69,7 +73,15 @@ def _tile_char(tile) -> str:  # noqa: ANN001 — VisibleTile
         return "?"
     if tile.monster:
         return "M"
-    return _TILE_CHARS.get(tile.type.value, tile.type.value[0])
+    return _TILE_CHARS[tile.type]
+
+
+def _noop_action(obs: Observation, action: Action) -> None:
+    pass
+
+
+def _noop_result(obs: Observation) -> None:
+    pass
 
 
 class DebugTracker:
@@ -81,22 +93,23 @@ class DebugTracker:
 
     def __init__(self) -> None:
         self.enabled = _is_debug()
-        self._prev_pos: tuple[int, int] | None = None
+        self._prev_x: int | None = None  # None until the first action
+        self._prev_y = 0
         self._prev_action_name: str | None = None
-        self._prev_direction: str | None = None
+        self._prev_direction: Direction | None = None
+        if not self.enabled:
+            # Debug mode is fixed for the process, so swap in no-ops once
+            # rather than checking ``enabled`` on every turn.
+            self.on_action = _noop_action  # type: ignore[method-assign]
+            self.on_result = _noop_result  # type: ignore[method-assign]
 
     def on_action(self, obs: Observation, action: Action) -> None:
         """Diagnose the chosen action against the current observation."""
-        if not self.enabled:
-            return
-
-        from crawlerverse import Move
-
         # Check for position anomalies vs previous turn
         self._check_position(obs)
 
         if not isinstance(action, Move):
-            self._prev_pos = obs.player.position
+            self._prev_x, self._prev_y = obs.player.position
             self._prev_action_name = type(action).__name__
             self._prev_direction = None
             return
@@ -109,7 +122,7 @@ class DebugTracker:
 
         # Check validity
         can = obs.can_move(action.direction)
-        dx, dy = _DIRECTION_OFFSETS.get(direction, (0, 0))
+        dx, dy = _DIRECTION_OFFSETS[direction]
         target_tile = obs.tile_at(px + dx, py + dy)
         if target_tile is None:
             target_desc = "NOT VISIBLE"
@@ -129,7 +142,8 @@ class DebugTracker:
                 "LLM chose a blocked direction"
             )
 
-        self._prev_pos = obs.player.position
+        self._prev_x = px
+        self._prev_y = py
         self._prev_action_name = "Move"
         self._prev_direction = direction
 
@@ -139,38 +153,39 @@ class DebugTracker:
         Optional — gives immediate feedback rather than waiting for
         the next ``on_action`` call.
         """
-        if not self.enabled:
-            return
         self._check_position(obs)
 
     # ------------------------------------------------------------------
 
     def _check_position(self, obs: Observation) -> None:
         """Compare current position with expected position from last action."""
-        if self._prev_pos is None:
+        prev_x = self._prev_x
+        if prev_x is None:
             return
 
-        dx = obs.player.position[0] - self._prev_pos[0]
-        dy = obs.player.position[1] - self._prev_pos[1]
+        prev_y = self._prev_y
+        x, y = obs.player.position
+        dx = x - prev_x
+        dy = y - prev_y
 
         if self._prev_action_name == "Move" and self._prev_direction:
-            ex, ey = _DIRECTION_OFFSETS.get(self._prev_direction, (0, 0))
-            if (dx, dy) == (ex, ey):
+            ex, ey = _DIRECTION_OFFSETS[self._prev_direction]
+            if dx == ex and dy == ey:
                 return  # move succeeded as expected
-            if (dx, dy) == (0, 0):
+            if dx == 0 and dy == 0:
                 return  # move was blocked — normal
             print(
                 f"  [DIAG] *** POSITION MISMATCH *** "
-                f"prev={self._prev_pos} action=move {self._prev_direction} "
+                f"prev=({prev_x}, {prev_y}) action=move {self._prev_direction} "
                 f"expected delta=({ex},{ey}) actual delta=({dx},{dy}) "
-                f"new pos={obs.player.position}"
+                f"new pos=({x}, {y})"
             )
-        elif self._prev_action_name != "Move" and (dx, dy) != (0, 0):
+        elif self._prev_action_name != "Move" and (dx or dy):
             print(
                 f"  [DIAG] *** UNEXPECTED MOVEMENT *** "
-                f"prev={self._prev_pos} action={self._prev_action_name} "
+                f"prev=({prev_x}, {prev_y}) action={self._prev_action_name} "
                 f"but position changed by ({dx},{dy}) "
-                f"to {obs.player.position}"
+                f"to ({x}, {y})"
             )
 
     def _print_grid(
@@ -178,7 +193,7 @@ class DebugTracker:
         obs: Observation,
         px: int,
         py: int,
-        direction: str,
+        direction: Direction,
     ) -> None:
         """Print a 5x5 ASCII grid centred on the player."""
         print(
@@ -188,14 +203,16 @@ class DebugTracker:
             "  [DIAG] Local map "
             "(@ = player, # = wall, . = floor, M = monster, ? = unseen):"
         )
+        tile_at = obs.tile_at
         for row_dy in range(-2, 3):
-            row = ""
-            for col_dx in range(-2, 3):
-                if col_dx == 0 and row_dy == 0:
-                    row += " @"
-                else:
-                    tile = obs.tile_at(px + col_dx, py + row_dy)
-                    row += " " + _tile_char(tile)
+            row = "".join(
+                [
+                    " @"
+                    if col_dx == 0 and row_dy == 0
+                    else " " + _tile_char(tile_at(px + col_dx, py + row_dy))
+                    for col_dx in range(-2, 3)
+                ]
+            )
             print(f"  [DIAG]  {row}")
 
 
@@ -25,26 +25,23 @@ Requirements (not included in crawlerverse):
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
 
+from _common import (
+    JsonReplyBuffer,
+    format_observation,
+    parse_action,
+    trim_history,
+)
 from diagnostics import DebugTracker
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from crawlerverse import (
-    Action,
-    Attack,
-    CrawlerClient,
-    Direction,
-    Drop,
-    EnterPortal,
-    Equip,
-    Move,
-    Observation,
-    Pickup,
-    RangedAttack,
-    Use,
+    AsyncCrawlerClient,
+    CompletedOutcome,
+    InProgressOutcome,
     Wait,
 )
 from crawlerverse.exceptions import (
@@ -82,101 +79,8 @@ Directions: north, south, east, west, northeast, northwest, southeast, southwest
 
 Respond ONLY with JSON. Include a "reasoning" field."""
 
-ACTION_MAP: dict[str, type[Action]] = {
-    "move": Move,
-    "attack": Attack,
-    "wait": Wait,
-    "pickup": Pickup,
-    "drop": Drop,
-    "use": Use,
-    "equip": Equip,
-    "enter_portal": EnterPortal,
-    "ranged_attack": RangedAttack,
-}
-
-
-def format_observation(obs: Observation) -> str:
-    """Format observation into a detailed prompt for the LLM."""
-    p = obs.player
-    lines = [
-        f"Turn {obs.turn} | Floor {obs.floor}",
-        f"HP: {p.hp}/{p.max_hp} | ATK: {p.attack} | DEF: {p.defense}",
-        f"Position: ({p.position[0]}, {p.position[1]})",
-    ]
-    if p.equipped_weapon:
-        lines.append(f"Weapon: {p.equipped_weapon}")
-    if p.equipped_armor:
-        lines.append(f"Armor: {p.equipped_armor}")
-    if obs.inventory:
-        inv = ", ".join(f"{i.name} ({i.type})" for i in obs.inventory)
-        lines.append(f"Inventory: {inv}")
-
-    passable = [d.value for d in Direction if obs.can_move(d)]
-    lines.append(f"Passable directions: {', '.join(passable) if passable else 'none'}")
-
-    lines.append("")
-    lines.append("Visible tiles:")
-    for tile in obs.visible_tiles:
-        parts = [f"  ({tile.x},{tile.y}) {tile.type}"]
-        if tile.monster:
-            m = tile.monster
-            parts.append(f"[MONSTER: {m.type} HP:{m.hp}/{m.max_hp}]")
-        if tile.items:
-            parts.append(f"[ITEMS: {', '.join(tile.items)}]")
-        lines.append(" ".join(parts))
-    if obs.messages:
-        lines.append("")
-        lines.append("Messages:")
-        for msg in obs.messages:
-            lines.append(f"  {msg}")
-    return "\n".join(lines)
-
-
-def parse_action(raw: str) -> Action:
-    """Parse LLM response into an Action, with fallback to Wait."""
-    text = raw.strip()
-    if text.startswith("```"):
-        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-    if text.endswith("```"):
-        text = text[:-3]
-    text = text.strip()
-
-    # Try to extract JSON from response
-    if not text.startswith("{"):
-        start = text.find("{")
-        if start >= 0:
-            end = text.rfind("}")
-            if end > start:
-                text = text[start : end + 1]
-
-    try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        log.warning("Parse fail: %s", text[:200])
-        return Wait(reasoning="parse error")
 
-    action_type = data.get("action", "wait")
-    cls = ACTION_MAP.get(action_type)
-    if cls is None:
-        return Wait(reasoning=f"unknown: {action_type}")
-
-    valid_fields = set(cls.model_fields.keys())
-    kwargs = {}
-    for k, v in data.items():
-        if k != "action" and k in valid_fields:
-            kwargs[k] = v
-
-    # Handle camelCase -> snake_case for itemType
-    if "itemType" in data and "item_type" in valid_fields:
-        kwargs["item_type"] = data["itemType"]
-
-    try:
-        return cls(**kwargs)
-    except Exception as e:
-        return Wait(reasoning=f"construct error: {e}")
-
-
-def main():
+async def main():
     max_turns = int(os.environ.get("MAX_TURNS", "25"))
     model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
     model_id = os.environ.get("MODEL_ID", f"local/{model}")
@@ -189,19 +93,19 @@ def main():
     print(f"Max turns: {max_turns}")
     print()
 
-    llm = OpenAI(
+    llm = AsyncOpenAI(
         base_url=os.environ["OPENAI_BASE_URL"],
         api_key=os.environ.get("OPENAI_API_KEY", "not-needed"),
     )
     conv: list[dict[str, str]] = [{"role": "system", "content": SYSTEM_PROMPT}]
 
-    with CrawlerClient(
+    async with AsyncCrawlerClient(
         api_key=os.environ["CRAWLERVERSE_API_KEY"],
         base_url=base_url,
     ) as client:
         resume_id = os.environ.get("GAME_ID")
         if resume_id:
-            state = client.games.get(resume_id)
+            state = await client.games.get(resume_id)
             if state.outcome.status != "in_progress":
                 print(f"Game {resume_id} already ended ({state.outcome.status})")
                 return
@@ -209,7 +113,7 @@ def main():
             obs = state.observation
             print(f"Resuming game: {game_id}")
         else:
-            game = client.games.create(model_id=model_id)
+            game = await client.games.create(model_id=model_id)
             game_id = game.game_id
             obs = game.observation
             print(f"Game started: {game_id}")
@@ -217,6 +121,9 @@ def main():
         print()
 
         debug = DebugTracker()
+        # Resolve the per-turn calls once rather than on every iteration.
+        complete = llm.chat.completions.create
+        send_action = client.games.action
 
         for turn_num in range(max_turns):
             prompt = format_observation(obs)
@@ -228,32 +135,53 @@ def main():
                 f"| Pos: ({p.position[0]},{p.position[1]}) ---"
             )
 
-            resp = llm.chat.completions.create(
+            # Stream the reply and hang up as soon as the JSON object closes,
+            # instead of waiting for any trailing text the model produces.
+            buf = JsonReplyBuffer()
+            async with await complete(
                 model=model,
                 messages=conv,
                 temperature=0.3,
                 max_tokens=200,
-            )
-            reply = resp.choices[0].message.content or ""
+                stream=True,
+            ) as stream:
+                async for chunk in stream:
+                    if chunk.choices and buf.feed(chunk.choices[0].delta.content or ""):
+                        break
+            reply = buf.text
             conv.append({"role": "assistant", "content": reply})
+            trim_history(conv, keep=1)
             action = parse_action(reply)
             print(f"  LLM -> {action.model_dump_json(by_alias=True)}")
-            debug.on_action(obs, action)
+
+            # Submit first, then run the local diagnostics while the request
+            # is in flight; sleep(0) lets the task start sending before that.
+            submit = asyncio.create_task(send_action(game_id, action))
+            try:
+                await asyncio.sleep(0)
+                debug.on_action(obs, action)
+            except BaseException:
+                # Don't orphan the in-flight POST if the diagnostics raise or
+                # the loop is cancelled; if it already finished, collect its
+                # result so asyncio doesn't report an unretrieved exception.
+                if not submit.cancel():
+                    submit.exception()
+                raise
 
             try:
-                result = client.games.action(game_id, action)
+                result = await submit
             except InvalidActionError as e:
                 print(f"  Invalid action: {e}. Sending Wait.")
-                result = client.games.action(game_id, Wait())
+                result = await send_action(game_id, Wait())
             except GameOverError:
                 print("  Game ended (GameOverError).")
                 try:
-                    state = client.games.get(game_id)
+                    state = await client.games.get(game_id)
                     o = state.outcome
                     print(f"  Status: {o.status}")
-                    if hasattr(o, "result"):
+                    if isinstance(o, CompletedOutcome):
                         print(f"  Result: {o.result}")
-                    if hasattr(o, "floor"):
+                    if not isinstance(o, InProgressOutcome):
                         print(f"  Floor: {o.floor}, Turns: {o.turns}")
                 except Exception:
                     pass
@@ -262,13 +190,13 @@ def main():
                 print(f"  API error ({e.status_code}): {e}")
                 # 500 likely means player died (server bug CRA-191)
                 try:
-                    state = client.games.get(game_id)
+                    state = await client.games.get(game_id)
                     if state.outcome.status != "in_progress":
                         o = state.outcome
                         print(f"  Game over! {o.status}")
-                        if hasattr(o, "result"):
+                        if isinstance(o, CompletedOutcome):
                             print(f"  Result: {o.result}")
-                        if hasattr(o, "floor"):
+                        if not isinstance(o, InProgressOutcome):
                             print(f"  Floor: {o.floor}, Turns: {o.turns}")
                         break
                 except Exception:
@@ -282,9 +210,9 @@ def main():
             if result.outcome.status != "in_progress":
                 o = result.outcome
                 print(f"\nGame over! {o.status}")
-                if hasattr(o, "result"):
+                if isinstance(o, CompletedOutcome):
                     print(f"  Result: {o.result}")
-                if hasattr(o, "floor"):
+                if not isinstance(o, InProgressOutcome):
                     print(f"  Floor: {o.floor}, Turns: {o.turns}")
                 break
 
@@ -299,4 +227,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -11,39 +11,44 @@ by setting OPENAI_BASE_URL:
     export OPENAI_BASE_URL=http://localhost:1234/v1
     python examples/openai_agent.py
 
+    # Servers without response_format support (JSON mode is on by default):
+    JSON_MODE=0 python examples/openai_agent.py
+
     # Resume a game (if it crashes or hits max turns):
     GAME_ID=<uuid> python examples/openai_agent.py
 
     # Enable debug diagnostics (local map, move validation):
     CRAWLERVERSE_DEBUG=1 python examples/openai_agent.py
 
+    # Reuse earlier decisions for repeated states (skips the LLM call):
+    ACTION_CACHE_SIZE=256 python examples/openai_agent.py
+
 Requirements (not included in crawlerverse):
     pip install openai
 """
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 
+from _common import (
+    HISTORY_TURNS,
+    SYSTEM_PROMPT,
+    ActionCache,
+    ActionJSON,
+    format_observation,
+    parse_action,
+    trim_history,
+)
 from diagnostics import create_debug_callback
 from openai import OpenAI
 
 from crawlerverse import (
     Action,
-    Attack,
+    CompletedOutcome,
     CrawlerClient,
-    Direction,
-    Drop,
-    EnterPortal,
-    Equip,
-    Move,
     Observation,
-    Pickup,
-    RangedAttack,
-    Use,
-    Wait,
     run_game,
 )
 
@@ -51,157 +56,58 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 log = logging.getLogger("crawlerverse")
 log.setLevel(logging.DEBUG)
 
-SYSTEM_PROMPT = """\
-You are an AI agent playing Crawler, a roguelike dungeon game.
-
-Each turn you receive an observation and must choose ONE action.
-Respond with a JSON object (no markdown, no explanation).
-
-## Actions
-
-Movement:
-  {"action": "move", "direction": "<dir>"}
-  {"action": "attack", "direction": "<dir>"}
-  {"action": "ranged_attack", "direction": "<dir>", "distance": <1-15>}
-
-Items:
-  {"action": "pickup"}
-  {"action": "drop", "itemType": "<item>"}
-  {"action": "use", "itemType": "<item>"}
-  {"action": "equip", "itemType": "<item>"}
-
-Other:
-  {"action": "wait"}
-  {"action": "enter_portal"}
-
-Directions: north, south, east, west, northeast, northwest, southeast, southwest
-
-## Strategy Tips
-- Kill monsters to clear the path. Attack adjacent monsters.
-- Pick up items (potions, weapons, armor) — they help you survive.
-- Equip weapons and armor for better stats.
-- Use health potions when HP is low.
-- Find stairs down to descend to the next floor.
-- Explore systematically; avoid getting surrounded.
-
-Always include a "reasoning" field explaining your decision.\
-"""
-
-# Map action strings to SDK classes
-ACTION_MAP: dict[str, type[Action]] = {
-    "move": Move,
-    "attack": Attack,
-    "wait": Wait,
-    "pickup": Pickup,
-    "drop": Drop,
-    "use": Use,
-    "equip": Equip,
-    "enter_portal": EnterPortal,
-    "ranged_attack": RangedAttack,
-}
-
-
-def format_observation(obs: Observation) -> str:
-    """Format observation into a detailed prompt for the LLM."""
-    p = obs.player
-    lines = [
-        f"Turn {obs.turn} | Floor {obs.floor}",
-        f"HP: {p.hp}/{p.max_hp} | ATK: {p.attack} | DEF: {p.defense}",
-        f"Position: ({p.position[0]}, {p.position[1]})",
-    ]
-
-    if p.equipped_weapon:
-        lines.append(f"Weapon: {p.equipped_weapon}")
-    if p.equipped_armor:
-        lines.append(f"Armor: {p.equipped_armor}")
-
-    if obs.inventory:
-        inv = ", ".join(f"{i.name} ({i.type})" for i in obs.inventory)
-        lines.append(f"Inventory: {inv}")
-
-    passable = [d.value for d in Direction if obs.can_move(d)]
-    lines.append(f"Passable directions: {', '.join(passable) if passable else 'none'}")
-
-    lines.append("")
-    lines.append("Visible tiles:")
-    for tile in obs.visible_tiles:
-        parts = [f"  ({tile.x},{tile.y}) {tile.type}"]
-        if tile.monster:
-            m = tile.monster
-            parts.append(f"[MONSTER: {m.type} HP:{m.hp}/{m.max_hp}]")
-        if tile.items:
-            parts.append(f"[ITEMS: {', '.join(tile.items)}]")
-        lines.append(" ".join(parts))
-
-    if obs.messages:
-        lines.append("")
-        lines.append("Messages:")
-        for msg in obs.messages:
-            lines.append(f"  {msg}")
-
-    return "\n".join(lines)
-
-
-def parse_action(raw: str) -> Action:
-    """Parse LLM response into an Action, with fallback to Wait."""
-    # Strip markdown fences if present
-    text = raw.strip()
-    if text.startswith("```"):
-        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-    if text.endswith("```"):
-        text = text[:-3]
-    text = text.strip()
-
-    try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        log.warning("Failed to parse LLM response as JSON: %s", text[:100])
-        return Wait(reasoning="Failed to parse response")
-
-    action_type = data.get("action", "wait")
-    cls = ACTION_MAP.get(action_type)
-    if cls is None:
-        log.warning("Unknown action type: %s", action_type)
-        return Wait(reasoning=f"Unknown action: {action_type}")
-
-    # Build kwargs from the response, filtering to known fields
-    valid_fields = set(cls.model_fields.keys())
-    kwargs = {k: v for k, v in data.items() if k in valid_fields and k != "action"}
-
-    # Handle camelCase → snake_case for itemType
-    if "itemType" in data and "item_type" in valid_fields:
-        kwargs["item_type"] = data["itemType"]
-
-    try:
-        return cls(**kwargs)
-    except Exception as e:
-        log.warning("Failed to construct %s: %s", action_type, e)
-        return Wait(reasoning=f"Failed to construct {action_type}")
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+# JSON mode makes the API return a bare JSON object, so replies parse on the
+# fast path instead of needing fence stripping or falling back to Wait.
+_JSON_MODE = {"type": "json_object"}
 
 
 def make_agent(
     model: str = "gpt-4o-mini",
+    cache_size: int = 0,
+    max_history_turns: int = HISTORY_TURNS,
+    json_mode: bool = True,
 ):
-    """Create an agent function that uses OpenAI to decide actions."""
-    client = OpenAI()
-    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    """Create an agent function that uses OpenAI to decide actions.
+
+    Only the last ``max_history_turns`` user/assistant pairs are resent
+    each turn. With ``cache_size`` > 0, actions are cached per game state
+    (see ``ActionCache``) and repeated states skip the LLM call.
+    ``json_mode`` requests a bare JSON object reply; disable it for servers
+    without ``response_format`` support.
+    """
+    create = OpenAI().chat.completions.create
+    cache = ActionCache(cache_size) if cache_size > 0 else None
+    messages = [_SYSTEM_MESSAGE]
+    # Some OpenAI-compatible servers reject json_object; let them opt out.
+    options = {"response_format": _JSON_MODE} if json_mode else {}
 
     def agent(obs: Observation) -> Action:
+        if cache is not None:
+            cached = cache.lookup(obs)
+            if cached is not None:
+                log.info("Turn %d: %s (cached)", obs.turn, ActionJSON(cached))
+                return cached
+
         prompt = format_observation(obs)
         messages.append({"role": "user", "content": prompt})
 
-        response = client.chat.completions.create(
+        response = create(
             model=model,
             messages=messages,
             temperature=0.3,
             max_tokens=200,
+            **options,
         )
 
         reply = response.choices[0].message.content or ""
         messages.append({"role": "assistant", "content": reply})
+        trim_history(messages, max_turns=max_history_turns, keep=1)
 
         action = parse_action(reply)
-        log.info("Turn %d: %s", obs.turn, action.model_dump_json(by_alias=True))
+        if cache is not None:
+            cache.store(action)
+        log.info("Turn %d: %s", obs.turn, ActionJSON(action))
         return action
 
     return agent
@@ -219,7 +125,9 @@ def main():
         print(f"Starting game with model: {model} (leaderboard ID: {model_id})")
     print()
 
-    agent = make_agent(model=model)
+    cache_size = int(os.environ.get("ACTION_CACHE_SIZE", "0"))
+    json_mode = os.environ.get("JSON_MODE", "1") != "0"
+    agent = make_agent(model=model, cache_size=cache_size, json_mode=json_mode)
 
     base_url = os.environ.get(
         "CRAWLERVERSE_BASE_URL", "https://www.crawlerver.se/api/agent"
@@ -239,7 +147,7 @@ def main():
     print(f"Game over! {outcome.status}")
     print(f"  Floor reached: {outcome.floor}")
     print(f"  Total turns: {outcome.turns}")
-    if hasattr(outcome, "result"):
+    if isinstance(outcome, CompletedOutcome):
         print(f"  Result: {outcome.result}")
     print(f"  Watch replay: {result.spectator_url}")
 
@@ -0,0 +1,135 @@
+"""Example: Play several Crawler games concurrently with OpenAI.
+
+Each game gets its own agent (and conversation history), but all games share
+one AsyncCrawlerClient and one AsyncOpenAI client, so their requests reuse
+the same connection pools while the LLM calls overlap.
+
+Usage:
+    export CRAWLERVERSE_API_KEY=cra_...
+    export OPENAI_API_KEY=sk-...
+    GAMES=4 python examples/openai_agent_async.py
+
+Works with any OpenAI-compatible API by setting OPENAI_BASE_URL, like
+openai_agent.py (set JSON_MODE=0 for servers without response_format).
+
+Requirements (not included in crawlerverse):
+    pip install openai
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+import httpx
+from _common import (
+    HISTORY_TURNS,
+    SYSTEM_PROMPT,
+    ActionJSON,
+    format_observation,
+    parse_action,
+    trim_history,
+)
+from diagnostics import create_debug_callback
+from openai import AsyncOpenAI
+
+from crawlerverse import (
+    Action,
+    AsyncCrawlerClient,
+    Observation,
+    async_run_game,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+log = logging.getLogger("crawlerverse")
+log.setLevel(logging.DEBUG)
+
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+# JSON mode makes the API return a bare JSON object, so replies parse on the
+# fast path instead of needing fence stripping or falling back to Wait.
+_JSON_MODE = {"type": "json_object"}
+
+
+def make_agent(
+    llm: AsyncOpenAI,
+    model: str = "gpt-4o-mini",
+    max_history_turns: int = HISTORY_TURNS,
+    json_mode: bool = True,
+):
+    """Create an async agent function backed by a shared AsyncOpenAI client."""
+    create = llm.chat.completions.create
+    messages = [_SYSTEM_MESSAGE]
+    # Some OpenAI-compatible servers reject json_object; let them opt out.
+    options = {"response_format": _JSON_MODE} if json_mode else {}
+
+    async def agent(obs: Observation) -> Action:
+        prompt = format_observation(obs)
+        messages.append({"role": "user", "content": prompt})
+
+        response = await create(
+            model=model,
+            messages=messages,
+            temperature=0.3,
+            max_tokens=200,
+            **options,
+        )
+
+        reply = response.choices[0].message.content or ""
+        messages.append({"role": "assistant", "content": reply})
+        trim_history(messages, max_turns=max_history_turns, keep=1)
+
+        action = parse_action(reply)
+        log.info("Turn %d: %s", obs.turn, ActionJSON(action))
+        return action
+
+    return agent
+
+
+async def main():
+    model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+    model_id = os.environ.get("MODEL_ID", f"openai/{model}")
+    games = int(os.environ.get("GAMES", "4"))
+    json_mode = os.environ.get("JSON_MODE", "1") != "0"
+
+    print(f"Starting {games} games with model: {model} (leaderboard ID: {model_id})")
+    print()
+
+    base_url = os.environ.get(
+        "CRAWLERVERSE_BASE_URL", "https://www.crawlerver.se/api/agent"
+    )
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=games * 2, keepalive_expiry=60.0),
+    )
+    async with (
+        AsyncOpenAI(http_client=http_client) as llm,
+        AsyncCrawlerClient(base_url=base_url) as client,
+    ):
+        results = await asyncio.gather(
+            *(
+                async_run_game(
+                    client,
+                    make_agent(llm, model=model, json_mode=json_mode),
+                    model_id=model_id,
+                    on_step=create_debug_callback(),
+                )
+                for _ in range(games)
+            ),
+            return_exceptions=True,
+        )
+
+    print()
+    for result in results:
+        if isinstance(result, BaseException):
+            print(f"Game failed: {result!r}")
+            continue
+        outcome = result.outcome
+        print(
+            f"{result.game_id}: {outcome.status}, floor {outcome.floor}, "
+            f"{outcome.turns} turns — {result.spectator_url}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,6 +2,9 @@
 
 __version__ = "0.2.2"
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from crawlerverse.actions import (
     Action,
     Attack,
@@ -13,9 +16,8 @@ from crawlerverse.actions import (
     RangedAttack,
     Use,
     Wait,
+    parse_action,
 )
-from crawlerverse.async_client import AsyncCrawlerClient
-from crawlerverse.client import CrawlerClient
 from crawlerverse.exceptions import (
     AuthenticationError,
     CrawlerAPIError,
@@ -43,9 +45,31 @@ from crawlerverse.models import (
     Player,
     VisibleTile,
 )
-from crawlerverse.runner import async_run_game, run_game
 from crawlerverse.types import Direction, GameStatus, TileType
 
+if TYPE_CHECKING:
+    from crawlerverse.async_client import AsyncCrawlerClient
+    from crawlerverse.client import CrawlerClient
+    from crawlerverse.runner import async_run_game, run_game
+
+# The clients and runners pull in httpx and asyncio, so they are imported on
+# first access; code that only builds models or actions never loads them.
+_LAZY_IMPORTS = {
+    "CrawlerClient": "crawlerverse.client",
+    "AsyncCrawlerClient": "crawlerverse.async_client",
+    "run_game": "crawlerverse.runner",
+    "async_run_game": "crawlerverse.runner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     # Version
     "__version__",
@@ -66,6 +90,7 @@ __all__ = [
     "RangedAttack",
     "Use",
     "Wait",
+    "parse_action",
     # Models
     "AbandonedOutcome",
     "ActionResponse",
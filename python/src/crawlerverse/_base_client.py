@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import logging
 import os
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from typing import Any, NoReturn
 
+import httpx
+from pydantic_core import from_json
+
 from crawlerverse import __version__
 from crawlerverse.exceptions import (
     AuthenticationError,
@@ -19,9 +23,21 @@ from crawlerverse.exceptions import (
 )
 from crawlerverse.models import parse_outcome
 
+logger = logging.getLogger("crawlerverse")
+
 ENV_KEY = "CRAWLERVERSE_API_KEY"
 DEFAULT_BASE_URL = "https://www.crawlerver.se/api/agent"
-DEFAULT_TIMEOUT = 30.0
+# Fail fast on an unreachable host while still giving the server the full
+# 30 seconds to answer a turn.
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_USER_AGENT = f"crawlerverse-python/{__version__}"
+# A game is one long sequence of requests to a single host, so keep pooled
+# connections alive across turns instead of re-handshaking each time.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
 
 
 def resolve_api_key(api_key: str | None) -> str:
@@ -46,11 +62,102 @@ def build_headers(api_key: str) -> dict[str, str]:
     """Build the default HTTP headers for API requests."""
     return {
         "Authorization": f"Bearer {api_key}",
-        "User-Agent": f"crawlerverse-python/{__version__}",
+        "User-Agent": _USER_AGENT,
         "Content-Type": "application/json",
     }
 
 
+def decode_error_body(response: httpx.Response) -> dict[str, Any]:
+    """Decode an error response body, falling back to its raw text.
+
+    Bodies that are empty or explicitly typed as non-JSON (e.g. an HTML
+    page from a proxy) skip the decode attempt entirely.
+    """
+    content = response.content
+    content_type = response.headers.get("content-type")
+    if content and (content_type is None or "json" in content_type):
+        try:
+            body = from_json(content)
+        except ValueError:
+            pass
+        else:
+            if isinstance(body, dict):
+                return body
+    logger.warning(
+        "Failed to parse error response as JSON (status=%d)",
+        response.status_code,
+    )
+    return {"error": response.text}
+
+
+def _build_validation(
+    message: str, body: dict[str, Any], headers: Mapping[str, str]
+) -> CrawlerAPIError:
+    return ValidationError(
+        status_code=400,
+        message=message,
+        details=body.get("details"),
+    )
+
+
+def _build_authentication(
+    message: str, body: dict[str, Any], headers: Mapping[str, str]
+) -> CrawlerAPIError:
+    return AuthenticationError(status_code=401, message=message)
+
+
+def _build_forbidden(
+    message: str, body: dict[str, Any], headers: Mapping[str, str]
+) -> CrawlerAPIError:
+    return ForbiddenError(status_code=403, message=message)
+
+
+def _build_not_found(
+    message: str, body: dict[str, Any], headers: Mapping[str, str]
+) -> CrawlerAPIError:
+    return NotFoundError(status_code=404, message=message)
+
+
+def _build_conflict(
+    message: str, body: dict[str, Any], headers: Mapping[str, str]
+) -> CrawlerAPIError:
+    outcome_data = body.get("outcome")
+    if outcome_data:
+        outcome = parse_outcome(outcome_data)
+        return GameOverError(status_code=409, message=message, outcome=outcome)
+    return CrawlerAPIError(status_code=409, message=message)
+
+
+def _build_invalid_action(
+    message: str, body: dict[str, Any], headers: Mapping[str, str]
+) -> CrawlerAPIError:
+    return InvalidActionError(
+        status_code=422,
+        message=message,
+        code=body.get("code", "UNKNOWN"),
+    )
+
+
+def _build_rate_limit(
+    message: str, body: dict[str, Any], headers: Mapping[str, str]
+) -> CrawlerAPIError:
+    retry_after = int(headers.get("retry-after", "60"))
+    return RateLimitError(status_code=429, message=message, retry_after=retry_after)
+
+
+_ERROR_BUILDERS: dict[
+    int, Callable[[str, dict[str, Any], Mapping[str, str]], CrawlerAPIError]
+] = {
+    400: _build_validation,
+    401: _build_authentication,
+    403: _build_forbidden,
+    404: _build_not_found,
+    409: _build_conflict,
+    422: _build_invalid_action,
+    429: _build_rate_limit,
+}
+
+
 def map_error_response(
     status_code: int,
     body: dict[str, Any],
@@ -61,39 +168,7 @@ def map_error_response(
     Always raises; the NoReturn type hint makes this explicit.
     """
     message = body.get("error", "Unknown error")
-
-    if status_code == 400:
-        raise ValidationError(
-            status_code=400,
-            message=message,
-            details=body.get("details"),
-        )
-
-    if status_code == 401:
-        raise AuthenticationError(status_code=401, message=message)
-
-    if status_code == 403:
-        raise ForbiddenError(status_code=403, message=message)
-
-    if status_code == 404:
-        raise NotFoundError(status_code=404, message=message)
-
-    if status_code == 409:
-        outcome_data = body.get("outcome")
-        if outcome_data:
-            outcome = parse_outcome(outcome_data)
-            raise GameOverError(status_code=409, message=message, outcome=outcome)
-        raise CrawlerAPIError(status_code=409, message=message)
-
-    if status_code == 422:
-        raise InvalidActionError(
-            status_code=422,
-            message=message,
-            code=body.get("code", "UNKNOWN"),
-        )
-
-    if status_code == 429:
-        retry_after = int(headers.get("retry-after", "60"))
-        raise RateLimitError(status_code=429, message=message, retry_after=retry_after)
-
-    raise CrawlerAPIError(status_code=status_code, message=message)
+    build = _ERROR_BUILDERS.get(status_code)
+    if build is None:
+        raise CrawlerAPIError(status_code=status_code, message=message)
+    raise build(message, body, headers)
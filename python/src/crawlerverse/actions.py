@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Annotated, Any, Literal
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, TypeAdapter
 
 from crawlerverse.models import CrawlerModel
 from crawlerverse.types import Direction
@@ -13,6 +13,8 @@ from crawlerverse.types import Direction
 class _ActionBase(CrawlerModel):
     """Base for action models that excludes None fields by default."""
 
+    model_config = ConfigDict(frozen=True)
+
     def model_dump(self, *, exclude_none: bool = True, **kwargs: Any) -> dict[str, Any]:
         return super().model_dump(exclude_none=exclude_none, **kwargs)
 
@@ -77,3 +79,18 @@ class RangedAttack(_ActionBase):
 Action = (
     Move | Attack | Wait | Pickup | Drop | Use | Equip | EnterPortal | RangedAttack
 )
+
+_action_adapter: TypeAdapter[Action] = TypeAdapter(
+    Annotated[Action, Field(discriminator="action")]
+)
+
+
+def parse_action(data: dict[str, Any] | str | bytes) -> Action:
+    """Parse an action dict or JSON document into the appropriate typed model.
+
+    Dispatches on the ``action`` field in a single pydantic-core call and
+    raises pydantic's ValidationError for malformed or unknown actions.
+    """
+    if isinstance(data, dict):
+        return _action_adapter.validate_python(data)
+    return _action_adapter.validate_json(data)
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-import logging
+import asyncio
+import builtins
+from collections.abc import Iterable
 from typing import Any
 
 import httpx
+from pydantic_core import to_json
 
 from crawlerverse._base_client import (
     DEFAULT_BASE_URL,
+    DEFAULT_LIMITS,
     DEFAULT_TIMEOUT,
     build_headers,
+    decode_error_body,
     map_error_response,
     resolve_api_key,
 )
@@ -24,8 +29,6 @@ from crawlerverse.models import (
     ListGamesResponse,
 )
 
-logger = logging.getLogger("crawlerverse")
-
 
 class _AsyncGamesResource:
     """Games namespace: client.games.* (async)."""
@@ -39,8 +42,8 @@ class _AsyncGamesResource:
         body: dict[str, Any] = {}
         if model_id is not None:
             body["modelId"] = model_id
-        data = await self._client._request("POST", "/games", json=body)
-        return CreateGameResponse.model_validate(data)
+        data = await self._client._request("POST", "/games", content=to_json(body))
+        return CreateGameResponse.model_validate_json(data)
 
     async def list(
         self,
@@ -53,24 +56,46 @@ class _AsyncGamesResource:
         if status is not None:
             params["status"] = status
         data = await self._client._request("GET", "/games", params=params)
-        return ListGamesResponse.model_validate(data)
+        return ListGamesResponse.model_validate_json(data)
 
     async def get(self, game_id: str) -> GameStateResponse:
         data = await self._client._request("GET", f"/games/{game_id}")
-        return GameStateResponse.model_validate(data)
+        return GameStateResponse.model_validate_json(data)
+
+    async def get_many(
+        self, game_ids: Iterable[str], *, concurrency: int = 20
+    ) -> builtins.list[GameStateResponse | BaseException]:
+        """Fetch several games concurrently, in the order given.
+
+        At most ``concurrency`` requests are in flight at once. A failed fetch
+        is returned in place as its exception instead of failing the batch.
+        Raises ValueError if ``concurrency`` is less than 1.
+        """
+        if concurrency < 1:
+            msg = f"concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(game_id: str) -> GameStateResponse:
+            async with semaphore:
+                return await self.get(game_id)
+
+        return await asyncio.gather(
+            *[fetch(game_id) for game_id in game_ids], return_exceptions=True
+        )
 
     async def action(self, game_id: str, action: Action) -> ActionResponse:
-        body = action.model_dump(by_alias=True, exclude_none=True)
+        body = action.model_dump_json(by_alias=True, exclude_none=True).encode()
         data = await self._client._request(
-            "POST", f"/games/{game_id}/action", json=body
+            "POST", f"/games/{game_id}/action", content=body
         )
-        return ActionResponse.model_validate(data)
+        return ActionResponse.model_validate_json(data)
 
     async def abandon(self, game_id: str) -> AbandonGameResponse:
         data = await self._client._request(
             "POST", f"/games/{game_id}/abandon"
         )
-        return AbandonGameResponse.model_validate(data)
+        return AbandonGameResponse.model_validate_json(data)
 
 
 class AsyncCrawlerClient:
@@ -81,47 +106,58 @@ class AsyncCrawlerClient:
         *,
         api_key: str | None = None,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         resolved_key = resolve_api_key(api_key)
         self._base_url = base_url.rstrip("/")
-        self._http = httpx.AsyncClient(
-            headers=build_headers(resolved_key),
-            timeout=timeout,
-            follow_redirects=True,
-        )
+        # A caller-supplied client keeps its own pool, timeout and transport
+        # settings; auth headers are sent per request so they never leak into
+        # its defaults, and it is left open on close().
+        self._owns_http = http_client is None
+        if http_client is None:
+            self._headers: dict[str, str] | None = None
+            self._http = httpx.AsyncClient(
+                headers=build_headers(resolved_key),
+                timeout=timeout,
+                follow_redirects=True,
+                http2=http2,
+                limits=limits,
+            )
+        else:
+            self._headers = build_headers(resolved_key)
+            self._http = http_client
         self.games = _AsyncGamesResource(self)
 
     async def health(self) -> HealthResponse:
         data = await self._request("GET", "/health")
-        return HealthResponse.model_validate(data)
+        return HealthResponse.model_validate_json(data)
 
     async def _request(
         self,
         method: str,
         path: str,
         *,
-        json: dict[str, Any] | None = None,
+        content: bytes | None = None,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> bytes:
         url = f"{self._base_url}{path}"
         response = await self._http.request(
-            method, url, json=json, params=params
+            method, url, content=content, params=params, headers=self._headers
         )
         if response.status_code >= 400:
-            try:
-                body = response.json()
-            except (ValueError, UnicodeDecodeError):
-                logger.warning(
-                    "Failed to parse error response as JSON (status=%d)",
-                    response.status_code,
-                )
-                body = {"error": response.text}
-            map_error_response(response.status_code, body, response.headers)
-        return response.json()
+            map_error_response(
+                response.status_code,
+                decode_error_body(response),
+                response.headers,
+            )
+        return response.content
 
     async def close(self) -> None:
-        await self._http.aclose()
+        if self._owns_http:
+            await self._http.aclose()
 
     async def __aenter__(self) -> AsyncCrawlerClient:
         return self
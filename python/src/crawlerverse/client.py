@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import logging
 from typing import Any
 
 import httpx
+from pydantic_core import to_json
 
 from crawlerverse._base_client import (
     DEFAULT_BASE_URL,
+    DEFAULT_LIMITS,
     DEFAULT_TIMEOUT,
     build_headers,
+    decode_error_body,
     map_error_response,
     resolve_api_key,
 )
@@ -24,8 +26,6 @@ from crawlerverse.models import (
     ListGamesResponse,
 )
 
-logger = logging.getLogger("crawlerverse")
-
 
 class _GamesResource:
     """Games namespace: client.games.*"""
@@ -37,8 +37,8 @@ class _GamesResource:
         body: dict[str, Any] = {}
         if model_id is not None:
             body["modelId"] = model_id
-        data = self._client._request("POST", "/games", json=body)
-        return CreateGameResponse.model_validate(data)
+        data = self._client._request("POST", "/games", content=to_json(body))
+        return CreateGameResponse.model_validate_json(data)
 
     def list(
         self,
@@ -51,22 +51,22 @@ class _GamesResource:
         if status is not None:
             params["status"] = status
         data = self._client._request("GET", "/games", params=params)
-        return ListGamesResponse.model_validate(data)
+        return ListGamesResponse.model_validate_json(data)
 
     def get(self, game_id: str) -> GameStateResponse:
         data = self._client._request("GET", f"/games/{game_id}")
-        return GameStateResponse.model_validate(data)
+        return GameStateResponse.model_validate_json(data)
 
     def action(self, game_id: str, action: Action) -> ActionResponse:
-        body = action.model_dump(by_alias=True, exclude_none=True)
+        body = action.model_dump_json(by_alias=True, exclude_none=True).encode()
         data = self._client._request(
-            "POST", f"/games/{game_id}/action", json=body
+            "POST", f"/games/{game_id}/action", content=body
         )
-        return ActionResponse.model_validate(data)
+        return ActionResponse.model_validate_json(data)
 
     def abandon(self, game_id: str) -> AbandonGameResponse:
         data = self._client._request("POST", f"/games/{game_id}/abandon")
-        return AbandonGameResponse.model_validate(data)
+        return AbandonGameResponse.model_validate_json(data)
 
 
 class CrawlerClient:
@@ -77,45 +77,58 @@ class CrawlerClient:
         *,
         api_key: str | None = None,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http_client: httpx.Client | None = None,
     ) -> None:
         resolved_key = resolve_api_key(api_key)
         self._base_url = base_url.rstrip("/")
-        self._http = httpx.Client(
-            headers=build_headers(resolved_key),
-            timeout=timeout,
-            follow_redirects=True,
-        )
+        # A caller-supplied client keeps its own pool, timeout and transport
+        # settings; auth headers are sent per request so they never leak into
+        # its defaults, and it is left open on close().
+        self._owns_http = http_client is None
+        if http_client is None:
+            self._headers: dict[str, str] | None = None
+            self._http = httpx.Client(
+                headers=build_headers(resolved_key),
+                timeout=timeout,
+                follow_redirects=True,
+                http2=http2,
+                limits=limits,
+            )
+        else:
+            self._headers = build_headers(resolved_key)
+            self._http = http_client
         self.games = _GamesResource(self)
 
     def health(self) -> HealthResponse:
         data = self._request("GET", "/health")
-        return HealthResponse.model_validate(data)
+        return HealthResponse.model_validate_json(data)
 
     def _request(
         self,
         method: str,
         path: str,
         *,
-        json: dict[str, Any] | None = None,
+        content: bytes | None = None,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> bytes:
         url = f"{self._base_url}{path}"
-        response = self._http.request(method, url, json=json, params=params)
+        response = self._http.request(
+            method, url, content=content, params=params, headers=self._headers
+        )
         if response.status_code >= 400:
-            try:
-                body = response.json()
-            except (ValueError, UnicodeDecodeError):
-                logger.warning(
-                    "Failed to parse error response as JSON (status=%d)",
-                    response.status_code,
-                )
-                body = {"error": response.text}
-            map_error_response(response.status_code, body, response.headers)
-        return response.json()
+            map_error_response(
+                response.status_code,
+                decode_error_body(response),
+                response.headers,
+            )
+        return response.content
 
     def close(self) -> None:
-        self._http.close()
+        if self._owns_http:
+            self._http.close()
 
     def __enter__(self) -> CrawlerClient:
         return self
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Annotated, Literal
+from functools import cached_property
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from pydantic.alias_generators import to_camel
@@ -29,6 +30,9 @@ _WALKABLE_TILES = {
     TileType.PORTAL,
 }
 
+# cached_property names on Observation, cleared by Observation.model_copy().
+_OBSERVATION_LOOKUPS = ("_tile_index", "_monster_tiles", "_inventory_names")
+
 
 class CrawlerModel(BaseModel):
     """Base model with camelCase alias support."""
@@ -99,27 +103,49 @@ class Observation(CrawlerModel):
     visible_tiles: list[VisibleTile]
     messages: list[str]
 
-    def tile_at(self, x: int, y: int) -> VisibleTile | None:
-        """Return the visible tile at the given coordinates, or None."""
-        for tile in self.visible_tiles:
-            if tile.x == x and tile.y == y:
-                return tile
-        return None
+    # Derived lookups are computed on first use. Observations are frozen, so
+    # they stay valid; model_copy() drops them when fields are replaced.
 
-    def monsters(self) -> list[tuple[VisibleTile, Monster]]:
-        """Return all visible tiles that contain a monster."""
+    @cached_property
+    def _tile_index(self) -> dict[tuple[int, int], VisibleTile]:
+        # Reversed so the first tile at a position wins, as a linear scan would.
+        return {(t.x, t.y): t for t in reversed(self.visible_tiles)}
+
+    @cached_property
+    def _monster_tiles(self) -> list[tuple[VisibleTile, Monster]]:
         return [
             (tile, tile.monster)
             for tile in self.visible_tiles
             if tile.monster is not None
         ]
 
+    @cached_property
+    def _inventory_names(self) -> frozenset[str]:
+        return frozenset([item.name.lower() for item in self.inventory])
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> Observation:
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _OBSERVATION_LOOKUPS:
+                copy.__dict__.pop(name, None)
+        return copy
+
+    def tile_at(self, x: int, y: int) -> VisibleTile | None:
+        """Return the visible tile at the given coordinates, or None."""
+        return self._tile_index.get((x, y))
+
+    def monsters(self) -> list[tuple[VisibleTile, Monster]]:
+        """Return all visible tiles that contain a monster."""
+        return list(self._monster_tiles)
+
     def nearest_monster(self) -> tuple[VisibleTile, Monster] | None:
         """Return the closest monster by Manhattan distance, or None."""
         px, py = self.player.position
         result: tuple[VisibleTile, Monster] | None = None
         best_dist = float("inf")
-        for tile, monster in self.monsters():
+        for tile, monster in self._monster_tiles:
             dist = abs(tile.x - px) + abs(tile.y - py)
             if dist < best_dist:
                 best_dist = dist
@@ -134,8 +160,7 @@ class Observation(CrawlerModel):
 
     def has_item(self, name: str) -> bool:
         """Check if the player has an item by name (case-insensitive)."""
-        name_lower = name.lower()
-        return any(item.name.lower() == name_lower for item in self.inventory)
+        return name.lower() in self._inventory_names
 
     def can_move(self, direction: Direction) -> bool:
         """Check if the player can move in the given direction.
@@ -152,11 +177,26 @@ class Observation(CrawlerModel):
             return False
         return tile.type in _WALKABLE_TILES
 
+    def passable_directions(self) -> list[Direction]:
+        """Return every direction ``can_move`` allows, in ``Direction`` order."""
+        px, py = self.player.position
+        get = self._tile_index.get
+        passable = []
+        for direction, (dx, dy) in _DIRECTION_OFFSETS.items():
+            tile = get((px + dx, py + dy))
+            if (
+                tile is not None
+                and tile.monster is None
+                and tile.type in _WALKABLE_TILES
+            ):
+                passable.append(direction)
+        return passable
+
     def __str__(self) -> str:
         p = self.player
-        monster_count = len(self.monsters())
+        monster_count = len(self._monster_tiles)
         item_count = sum(len(t.items) for t in self.visible_tiles)
-        inv_names = ", ".join(i.name for i in self.inventory) or "empty"
+        inv_names = ", ".join([i.name for i in self.inventory]) or "empty"
         lines = [
             f"Turn {self.turn} | Floor {self.floor} | HP {p.hp}/{p.max_hp}"
             f" | Pos ({p.position[0]},{p.position[1]})",
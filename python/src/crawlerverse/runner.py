@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
+import random
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
 from crawlerverse.exceptions import GameOverError, InvalidActionError, RateLimitError
@@ -22,6 +24,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("crawlerverse")
 
+# Jitter added on top of Retry-After so agents throttled together do not all
+# retry at the same instant.
+_BACKOFF_BASE = 0.05
+_BACKOFF_CAP = 30.0
+
+
+def _next_backoff(prev: float) -> float:
+    """Return the next decorrelated-jitter delay after ``prev``."""
+    return min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, prev * 3))
+
+
+def _discard_step(task: asyncio.Future[None]) -> None:
+    """Cancel a pending on_step task, or consume the error of a finished one."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
 
 def run_game(
     client: CrawlerClient,
@@ -35,7 +55,8 @@ def run_game(
     """Run a complete game loop.
 
     Creates a new game (or resumes an existing one), calls agent_fn each turn,
-    and returns the final result.
+    and returns the final result. Pass the same client to every game so each
+    turn reuses its pooled keep-alive connection instead of reconnecting.
     """
     if game_id is not None:
         state = client.games.get(game_id)
@@ -56,6 +77,7 @@ def run_game(
     logger.info("Game %s started. Watch: %s", game_id, spectator_url)
 
     consecutive_invalid = 0
+    backoff = _BACKOFF_BASE
 
     while True:
         try:
@@ -68,30 +90,34 @@ def run_game(
         try:
             result = client.games.action(game_id, action)
             consecutive_invalid = 0
+            backoff = _BACKOFF_BASE
         except InvalidActionError as e:
             consecutive_invalid += 1
-            logger.warning(
-                "Invalid action (%d/%d): %s [code=%s] "
-                "[game=%s, turn=%d, action=%s]",
-                consecutive_invalid,
-                max_invalid_actions,
-                e.message,
-                e.code,
-                game_id,
-                observation.turn,
-                action.model_dump_json(by_alias=True),
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Invalid action (%d/%d): %s [code=%s] "
+                    "[game=%s, turn=%d, action=%s]",
+                    consecutive_invalid,
+                    max_invalid_actions,
+                    e.message,
+                    e.code,
+                    game_id,
+                    observation.turn,
+                    action.model_dump_json(by_alias=True),
+                )
             if consecutive_invalid >= max_invalid_actions:
                 raise
             continue
         except RateLimitError as e:
+            backoff = _next_backoff(backoff)
+            delay = e.retry_after + backoff
             logger.warning(
-                "Rate limited. Sleeping %d seconds. [game=%s, turn=%d]",
-                e.retry_after,
+                "Rate limited. Sleeping %.1f seconds. [game=%s, turn=%d]",
+                delay,
                 game_id,
                 observation.turn,
             )
-            time.sleep(e.retry_after)
+            time.sleep(delay)
             continue
         except GameOverError as e:
             logger.info("Game %s ended between turns: %s", game_id, e.message)
@@ -117,14 +143,24 @@ def run_game(
 
 async def async_run_game(
     client: AsyncCrawlerClient,
-    agent_fn: Callable[[Observation], Action],
+    agent_fn: Callable[[Observation], Action | Awaitable[Action]],
     *,
     model_id: str | None = None,
     game_id: str | None = None,
     max_invalid_actions: int = 5,
-    on_step: Callable[[Observation, Action], None] | None = None,
+    on_step: (
+        Callable[[Observation, Action], None | Awaitable[None]] | None
+    ) = None,
 ) -> GameResult:
-    """Async version of run_game."""
+    """Async version of run_game.
+
+    agent_fn may be a plain function or a coroutine function, so agents can
+    await an async LLM client without blocking the event loop. on_step may
+    also be a coroutine function: each call runs in the background while the
+    next turn proceeds, one at a time and in turn order, and is awaited
+    before this returns. If one raises, the game stops before its next action
+    and the callback's exception propagates.
+    """
     if game_id is not None:
         state = await client.games.get(game_id)
         observation = state.observation
@@ -144,60 +180,89 @@ async def async_run_game(
     logger.info("Game %s started. Watch: %s", game_id, spectator_url)
 
     consecutive_invalid = 0
+    backoff = _BACKOFF_BASE
+    step_task: asyncio.Future[None] | None = None
 
-    while True:
-        try:
-            action = agent_fn(observation)
-        except Exception as e:
-            raise RuntimeError(
-                f"Agent function failed [game={game_id}, turn={observation.turn}]"
-            ) from e
+    try:
+        while True:
+            try:
+                action = agent_fn(observation)
+                if inspect.isawaitable(action):
+                    action = await action
+            except Exception as e:
+                raise RuntimeError(
+                    f"Agent function failed [game={game_id}, turn={observation.turn}]"
+                ) from e
 
-        try:
-            result = await client.games.action(game_id, action)
-            consecutive_invalid = 0
-        except InvalidActionError as e:
-            consecutive_invalid += 1
-            logger.warning(
-                "Invalid action (%d/%d): %s [code=%s] "
-                "[game=%s, turn=%d, action=%s]",
-                consecutive_invalid,
-                max_invalid_actions,
-                e.message,
-                e.code,
-                game_id,
-                observation.turn,
-                action.model_dump_json(by_alias=True),
-            )
-            if consecutive_invalid >= max_invalid_actions:
-                raise
-            continue
-        except RateLimitError as e:
-            logger.warning(
-                "Rate limited. Sleeping %d seconds. [game=%s, turn=%d]",
-                e.retry_after,
-                game_id,
-                observation.turn,
-            )
-            await asyncio.sleep(e.retry_after)
-            continue
-        except GameOverError as e:
-            logger.info("Game %s ended between turns: %s", game_id, e.message)
-            return GameResult(
-                game_id=game_id,
-                spectator_url=spectator_url,
-                outcome=e.outcome,
-            )
+            # Surface a failed on_step before acting again, as a sync
+            # callback would have.
+            if step_task is not None and step_task.done():
+                step_task.result()
 
-        if on_step is not None:
-            on_step(observation, action)
+            try:
+                result = await client.games.action(game_id, action)
+                consecutive_invalid = 0
+                backoff = _BACKOFF_BASE
+            except InvalidActionError as e:
+                consecutive_invalid += 1
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Invalid action (%d/%d): %s [code=%s] "
+                        "[game=%s, turn=%d, action=%s]",
+                        consecutive_invalid,
+                        max_invalid_actions,
+                        e.message,
+                        e.code,
+                        game_id,
+                        observation.turn,
+                        action.model_dump_json(by_alias=True),
+                    )
+                if consecutive_invalid >= max_invalid_actions:
+                    raise
+                continue
+            except RateLimitError as e:
+                backoff = _next_backoff(backoff)
+                delay = e.retry_after + backoff
+                logger.warning(
+                    "Rate limited. Sleeping %.1f seconds. [game=%s, turn=%d]",
+                    delay,
+                    game_id,
+                    observation.turn,
+                )
+                await asyncio.sleep(delay)
+                continue
+            except GameOverError as e:
+                logger.info("Game %s ended between turns: %s", game_id, e.message)
+                final = GameResult(
+                    game_id=game_id,
+                    spectator_url=spectator_url,
+                    outcome=e.outcome,
+                )
+                break
 
-        observation = result.observation
+            if on_step is not None:
+                step = on_step(observation, action)
+                if inspect.isawaitable(step):
+                    if step_task is not None:
+                        await step_task
+                    step_task = asyncio.ensure_future(step)
 
-        if not isinstance(result.outcome, InProgressOutcome):
-            logger.info("Game %s finished: %s", game_id, result.outcome.status)
-            return GameResult(
-                game_id=game_id,
-                spectator_url=spectator_url,
-                outcome=result.outcome,
-            )
+            observation = result.observation
+
+            if not isinstance(result.outcome, InProgressOutcome):
+                logger.info("Game %s finished: %s", game_id, result.outcome.status)
+                final = GameResult(
+                    game_id=game_id,
+                    spectator_url=spectator_url,
+                    outcome=result.outcome,
+                )
+                break
+    except BaseException:
+        # Let the error that ended the game propagate, not the callback's.
+        if step_task is not None:
+            _discard_step(step_task)
+        raise
+
+    if step_task is not None:
+        await step_task
+    return final
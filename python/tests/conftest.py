@@ -0,0 +1,44 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+HEALTH_JSON = {
+    "status": "ok",
+    "service": "crawler-agent-api",
+    "timestamp": "2026-02-27T00:00:00Z",
+}
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Plain HTTP proxy stand-in: records the request target, answers health."""
+
+    def do_GET(self) -> None:
+        self.server.targets.append(self.path)
+        body = json.dumps(HEALTH_JSON).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def env_proxy(monkeypatch):
+    """Run a local proxy, point HTTP_PROXY at it and yield its request log."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyHandler)
+    server.targets = []
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    for name in ("ALL_PROXY", "all_proxy", "NO_PROXY", "no_proxy", "http_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_port}")
+    yield server.targets
+    server.shutdown()
+    server.server_close()
@@ -1,5 +1,8 @@
 import json
 
+import pytest
+from pydantic import ValidationError
+
 from crawlerverse.actions import (
     Attack,
     Drop,
@@ -10,6 +13,7 @@ from crawlerverse.actions import (
     RangedAttack,
     Use,
     Wait,
+    parse_action,
 )
 from crawlerverse.types import Direction
 
@@ -25,6 +29,12 @@ class TestMove:
         a = Move(direction=Direction.EAST, reasoning="Exploring east corridor")
         assert a.reasoning == "Exploring east corridor"
 
+    def test_frozen(self):
+        a = Move(direction=Direction.NORTH)
+        with pytest.raises(ValidationError):
+            a.direction = Direction.SOUTH
+        assert hash(a) == hash(Move(direction=Direction.NORTH))
+
     def test_serializes_to_camel_case(self):
         a = Move(direction=Direction.NORTH)
         data = json.loads(a.model_dump_json(by_alias=True))
@@ -94,3 +104,22 @@ class TestActionUnionSerialization:
         a = Move(direction=Direction.NORTH)
         data = json.loads(a.model_dump_json(by_alias=True, exclude_none=True))
         assert "reasoning" not in data
+
+
+class TestParseAction:
+    def test_dict_with_camel_case_alias(self):
+        a = parse_action({"action": "use", "itemType": "health-potion"})
+        assert isinstance(a, Use)
+        assert a.item_type == "health-potion"
+
+    def test_json_bytes(self):
+        a = parse_action(b'{"action": "move", "direction": "north", "extra": 1}')
+        assert a == Move(direction=Direction.NORTH)
+
+    def test_unknown_action_raises(self):
+        with pytest.raises(ValidationError):
+            parse_action('{"action": "fly"}')
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ValidationError):
+            parse_action("{not json")
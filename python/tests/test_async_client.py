@@ -1,3 +1,4 @@
+import httpx
 import pytest
 
 from crawlerverse.actions import Move, Wait
@@ -37,6 +38,13 @@ async def client(monkeypatch):
         yield c
 
 
+async def test_env_proxy_honoured(monkeypatch, env_proxy):
+    monkeypatch.setenv("CRAWLERVERSE_API_KEY", "cra_test")
+    async with AsyncCrawlerClient(base_url="http://api.example.test/api/agent") as c:
+        assert (await c.health()).status == "ok"
+    assert env_proxy == ["http://api.example.test/api/agent/health"]
+
+
 async def test_create_game(client, httpx_mock):
     httpx_mock.add_response(
         method="POST",
@@ -88,6 +96,32 @@ async def test_get_game(client, httpx_mock):
     assert state.observation.turn == 1
 
 
+async def test_get_many_games(client, httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://test.example.com/api/agent/games/game-1",
+        json={
+            "observation": OBSERVATION_JSON,
+            "outcome": {"status": "in_progress"},
+        },
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://test.example.com/api/agent/games/missing",
+        json={"error": "Game not found"},
+        status_code=404,
+    )
+    results = await client.games.get_many(["game-1", "missing"], concurrency=1)
+    assert results[0].observation.turn == 1
+    assert isinstance(results[1], NotFoundError)
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_get_many_rejects_bad_concurrency(client, concurrency):
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await client.games.get_many(["game-1"], concurrency=concurrency)
+
+
 async def test_health(client, httpx_mock):
     httpx_mock.add_response(
         method="GET",
@@ -108,6 +142,26 @@ class TestAsyncClientInit:
         with pytest.raises(AuthenticationError, match="No API key"):
             AsyncCrawlerClient()
 
+    async def test_borrowed_http_client(self, monkeypatch, httpx_mock):
+        monkeypatch.setenv("CRAWLERVERSE_API_KEY", "cra_test123")
+        httpx_mock.add_response(
+            url="https://test.example.com/api/agent/health",
+            json={
+                "status": "ok",
+                "service": "crawler-agent-api",
+                "timestamp": "2025-02-02T10:30:00Z",
+            },
+        )
+        http = httpx.AsyncClient()
+        async with AsyncCrawlerClient(
+            base_url="https://test.example.com/api/agent", http_client=http
+        ) as c:
+            assert (await c.health()).status == "ok"
+        request = httpx_mock.get_request()
+        assert request.headers["Authorization"] == "Bearer cra_test123"
+        assert not http.is_closed
+        await http.aclose()
+
 
 class TestAsyncGamesAction:
     async def test_action_422_raises(self, client, httpx_mock):
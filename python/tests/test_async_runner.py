@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 import pytest
 
 from crawlerverse.actions import Action, Move, Wait
@@ -281,6 +284,39 @@ class TestAsyncRunGameErrorHandling:
             await async_run_game(client, bad_agent)
         assert isinstance(exc_info.value.__cause__, ValueError)
 
+    async def test_async_agent_is_awaited(self, client, httpx_mock):
+        async def async_agent(obs: Observation) -> Action:
+            return Move(direction=Direction.NORTH)
+
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games",
+            json={
+                "gameId": "game-1",
+                "observation": OBSERVATION_JSON,
+                "spectatorUrl": "https://crawlerver.se/spectate/game-1",
+            },
+            status_code=201,
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games/game-1/action",
+            json={
+                "observation": OBSERVATION_JSON,
+                "outcome": {
+                    "status": "completed",
+                    "result": "death",
+                    "floor": 1,
+                    "turns": 1,
+                },
+            },
+        )
+
+        result = await async_run_game(client, async_agent)
+        assert isinstance(result.outcome, CompletedOutcome)
+        requests = httpx_mock.get_requests()
+        assert json.loads(requests[-1].content)["action"] == "move"
+
 
 class TestAsyncRunGameOnStep:
     async def test_on_step_called(self, client, httpx_mock):
@@ -318,6 +354,48 @@ class TestAsyncRunGameOnStep:
         assert len(steps) == 1
         assert steps[0] == (1, "wait")
 
+    async def test_async_on_step_runs_in_turn_order(self, client, httpx_mock):
+        steps = []
+
+        async def on_step(obs, action):
+            await asyncio.sleep(0)
+            steps.append(obs.turn)
+
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games",
+            json={
+                "gameId": "game-1",
+                "observation": OBSERVATION_JSON,
+                "spectatorUrl": "https://crawlerver.se/spectate/game-1",
+            },
+            status_code=201,
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games/game-1/action",
+            json={
+                "observation": {**OBSERVATION_JSON, "turn": 2},
+                "outcome": {"status": "in_progress"},
+            },
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games/game-1/action",
+            json={
+                "observation": OBSERVATION_JSON,
+                "outcome": {
+                    "status": "completed",
+                    "result": "victory",
+                    "floor": 5,
+                    "turns": 2,
+                },
+            },
+        )
+
+        await async_run_game(client, _agent_always_wait, on_step=on_step)
+        assert steps == [1, 2]
+
     async def test_on_step_exception_propagates(self, client, httpx_mock):
         """on_step callback errors propagate and crash the game loop."""
 
@@ -349,3 +427,77 @@ class TestAsyncRunGameOnStep:
                 _agent_always_wait,
                 on_step=bad_callback,
             )
+
+    async def test_async_on_step_exception_stops_game(self, client, httpx_mock):
+        """A failed async on_step stops the game before its next action."""
+
+        async def bad_callback(obs, action):
+            raise ValueError("Callback failed")
+
+        async def agent(obs):
+            await asyncio.sleep(0)
+            return Wait()
+
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games",
+            json={
+                "gameId": "game-1",
+                "observation": OBSERVATION_JSON,
+                "spectatorUrl": "https://crawlerver.se/spectate/game-1",
+            },
+            status_code=201,
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games/game-1/action",
+            json={
+                "observation": {**OBSERVATION_JSON, "turn": 2},
+                "outcome": {"status": "in_progress"},
+            },
+        )
+
+        with pytest.raises(ValueError, match="Callback failed"):
+            await async_run_game(client, agent, on_step=bad_callback)
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_async_on_step_error_does_not_mask_game_error(
+        self, client, httpx_mock
+    ):
+        """The error that ends the game wins over a pending on_step error."""
+
+        async def bad_callback(obs, action):
+            raise ValueError("Callback failed")
+
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games",
+            json={
+                "gameId": "game-1",
+                "observation": OBSERVATION_JSON,
+                "spectatorUrl": "https://crawlerver.se/spectate/game-1",
+            },
+            status_code=201,
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games/game-1/action",
+            json={
+                "observation": {**OBSERVATION_JSON, "turn": 2},
+                "outcome": {"status": "in_progress"},
+            },
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://test.example.com/api/agent/games/game-1/action",
+            json={"error": "Invalid", "code": "INVALID_ACTION"},
+            status_code=422,
+        )
+
+        with pytest.raises(InvalidActionError):
+            await async_run_game(
+                client,
+                _agent_always_wait,
+                max_invalid_actions=1,
+                on_step=bad_callback,
+            )
@@ -1,9 +1,15 @@
 import os
 from unittest.mock import patch
 
+import httpx
 import pytest
 
-from crawlerverse._base_client import build_headers, map_error_response, resolve_api_key
+from crawlerverse._base_client import (
+    build_headers,
+    decode_error_body,
+    map_error_response,
+    resolve_api_key,
+)
 from crawlerverse.exceptions import (
     AuthenticationError,
     ForbiddenError,
@@ -40,6 +46,29 @@ class TestBuildHeaders:
         assert "crawlerverse-python/" in headers["User-Agent"]
 
 
+class TestDecodeErrorBody:
+    def test_json_object(self):
+        response = httpx.Response(400, json={"error": "Bad", "details": {"a": 1}})
+        assert decode_error_body(response) == {"error": "Bad", "details": {"a": 1}}
+
+    def test_non_json_falls_back_to_text(self):
+        response = httpx.Response(502, text="<html>Bad Gateway</html>")
+        assert decode_error_body(response) == {"error": "<html>Bad Gateway</html>"}
+
+    def test_non_json_content_type_not_decoded(self):
+        response = httpx.Response(
+            503, content=b'{"error": "x"}', headers={"content-type": "text/html"}
+        )
+        assert decode_error_body(response) == {"error": '{"error": "x"}'}
+
+    def test_empty_body(self):
+        assert decode_error_body(httpx.Response(500)) == {"error": ""}
+
+    def test_non_object_falls_back_to_text(self):
+        response = httpx.Response(500, json=["oops"])
+        assert decode_error_body(response) == {"error": '["oops"]'}
+
+
 class TestMapErrorResponse:
     def test_401(self):
         with pytest.raises(AuthenticationError):
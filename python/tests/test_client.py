@@ -1,5 +1,6 @@
 import json
 
+import httpx
 import pytest
 
 from crawlerverse.actions import Move, Wait
@@ -51,6 +52,55 @@ class TestClientInit:
         with CrawlerClient() as c:
             assert c is not None
 
+    def test_exported_from_package(self):
+        import crawlerverse
+
+        assert crawlerverse.CrawlerClient is CrawlerClient
+        assert "CrawlerClient" in crawlerverse.__all__
+
+    def test_custom_limits(self, monkeypatch):
+        monkeypatch.setenv("CRAWLERVERSE_API_KEY", "cra_test")
+        seen = {}
+
+        class RecordingClient(httpx.Client):
+            def __init__(self, **kwargs):
+                seen.update(kwargs)
+                super().__init__(**kwargs)
+
+        monkeypatch.setattr(httpx, "Client", RecordingClient)
+        limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+        with CrawlerClient(limits=limits, http2=False):
+            pass
+        assert seen["limits"] is limits
+        assert seen["http2"] is False
+
+    def test_env_proxy_honoured(self, monkeypatch, env_proxy):
+        monkeypatch.setenv("CRAWLERVERSE_API_KEY", "cra_test")
+        with CrawlerClient(base_url="http://api.example.test/api/agent") as c:
+            assert c.health().status == "ok"
+        assert env_proxy == ["http://api.example.test/api/agent/health"]
+
+    def test_borrowed_http_client(self, monkeypatch, httpx_mock):
+        monkeypatch.setenv("CRAWLERVERSE_API_KEY", "cra_test")
+        httpx_mock.add_response(
+            url="https://test.example.com/api/agent/health",
+            json={
+                "status": "ok",
+                "service": "crawler-agent-api",
+                "timestamp": "2026-02-27T00:00:00Z",
+            },
+        )
+        http = httpx.Client()
+        with CrawlerClient(
+            base_url="https://test.example.com/api/agent", http_client=http
+        ) as c:
+            assert c.health().status == "ok"
+        request = httpx_mock.get_request()
+        assert request.headers["Authorization"] == "Bearer cra_test"
+        assert "Authorization" not in http.headers
+        assert not http.is_closed
+        http.close()
+
 
 class TestGamesCreate:
     def test_create_game(self, client, httpx_mock):
@@ -90,6 +140,13 @@ class TestGamesAction:
         assert result.observation.turn == 1
         assert isinstance(result.outcome, InProgressOutcome)
 
+        request = httpx_mock.get_request()
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "action": "move",
+            "direction": "north",
+        }
+
     def test_action_422_raises(self, client, httpx_mock):
         httpx_mock.add_response(
             method="POST",
@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from crawlerverse.models import (
     AbandonedOutcome,
     CompletedOutcome,
@@ -61,6 +63,9 @@ OBSERVATION_JSON = {
     "messages": ["The rat bites you for 3 damage", "You attack the rat"],
 }
 
+# Observation is frozen, so read-only tests can share one validated instance.
+OBSERVATION = Observation.model_validate(OBSERVATION_JSON)
+
 
 class TestPlayer:
     def test_parse_from_camel_case(self):
@@ -110,14 +115,26 @@ class TestObservation:
         assert len(obs.messages) == 2
 
     def test_tile_at(self):
-        obs = Observation.model_validate(OBSERVATION_JSON)
+        obs = OBSERVATION
         tile = obs.tile_at(6, 8)
         assert tile is not None
         assert tile.monster is not None
         assert obs.tile_at(99, 99) is None
 
+    def test_lookups_after_model_copy(self):
+        obs = OBSERVATION
+        assert obs.tile_at(6, 8) is not None
+        moved = obs.model_copy(
+            update={"visible_tiles": [VisibleTile.model_validate(TILE_WALL_JSON)]}
+        )
+        assert moved.tile_at(6, 8) is None
+        assert moved.monsters() == []
+        assert obs.has_item("iron-sword")
+        assert not obs.model_copy(update={"inventory": []}).has_item("iron-sword")
+        assert obs == Observation.model_validate(OBSERVATION_JSON)
+
     def test_monsters(self):
-        obs = Observation.model_validate(OBSERVATION_JSON)
+        obs = OBSERVATION
         monsters = obs.monsters()
         assert len(monsters) == 1
         tile, monster = monsters[0]
@@ -125,25 +142,25 @@ class TestObservation:
         assert tile.x == 6
 
     def test_nearest_monster(self):
-        obs = Observation.model_validate(OBSERVATION_JSON)
+        obs = OBSERVATION
         result = obs.nearest_monster()
         assert result is not None
         tile, monster = result
         assert monster.type == "rat"
 
     def test_items_at_feet(self):
-        obs = Observation.model_validate(OBSERVATION_JSON)
+        obs = OBSERVATION
         items = obs.items_at_feet()
         assert items == ["gold-coin", "health-potion"]
 
     def test_has_item(self):
-        obs = Observation.model_validate(OBSERVATION_JSON)
+        obs = OBSERVATION
         assert obs.has_item("iron-sword") is True
         assert obs.has_item("Iron-Sword") is True
         assert obs.has_item("gold-ring") is False
 
     def test_can_move(self):
-        obs = Observation.model_validate(OBSERVATION_JSON)
+        obs = OBSERVATION
         # EAST (6,8) has a monster — cannot move there
         assert obs.can_move(Direction.EAST) is False
         # NORTH (5,7) is a wall — cannot move there
@@ -162,46 +179,64 @@ class TestObservation:
         obs = Observation.model_validate(obs_data)
         assert obs.can_move(Direction.EAST) is True
 
+    def test_passable_directions(self):
+        obs_data = {
+            **OBSERVATION_JSON,
+            "visibleTiles": [
+                TILE_WITH_MONSTER_JSON,
+                TILE_WALL_JSON,
+                TILE_WITH_ITEMS_JSON,
+                {"x": 5, "y": 9, "type": "door", "items": []},
+                {"x": 4, "y": 7, "type": "floor", "items": []},
+            ],
+        }
+        obs = Observation.model_validate(obs_data)
+        assert obs.passable_directions() == [Direction.SOUTH, Direction.NORTHWEST]
+        assert obs.passable_directions() == [d for d in Direction if obs.can_move(d)]
+
     def test_str(self):
-        obs = Observation.model_validate(OBSERVATION_JSON)
+        obs = OBSERVATION
         s = str(obs)
         assert "Turn 47" in s
         assert "Floor 3" in s
         assert "12/20" in s
 
     def test_serializes_to_camel_case(self):
-        obs = Observation.model_validate(OBSERVATION_JSON)
+        obs = OBSERVATION
         data = json.loads(obs.model_dump_json(by_alias=True))
         assert "visibleTiles" in data
-        assert "maxHp" in data["player"]
+        assert data["player"]["maxHp"] == 20
+        assert "max_hp" not in data["player"]
 
 
 class TestOutcomes:
-    def test_in_progress(self):
-        o = parse_outcome({"status": "in_progress"})
-        assert isinstance(o, InProgressOutcome)
-
-    def test_completed_victory(self):
-        o = parse_outcome(
-            {"status": "completed", "result": "victory", "floor": 5, "turns": 187}
-        )
-        assert isinstance(o, CompletedOutcome)
-        assert o.result == "victory"
-        assert o.floor == 5
-
-    def test_completed_death(self):
-        o = parse_outcome(
-            {"status": "completed", "result": "death", "floor": 3, "turns": 47}
-        )
-        assert isinstance(o, CompletedOutcome)
-        assert o.result == "death"
-
-    def test_abandoned(self):
-        o = parse_outcome(
-            {"status": "abandoned", "reason": "timeout", "floor": 2, "turns": 30}
-        )
-        assert isinstance(o, AbandonedOutcome)
-        assert o.reason == "timeout"
+    @pytest.mark.parametrize(
+        "data,cls,expected",
+        [
+            ({"status": "in_progress"}, InProgressOutcome, {}),
+            (
+                {"status": "completed", "result": "victory", "floor": 5, "turns": 187},
+                CompletedOutcome,
+                {"result": "victory", "floor": 5},
+            ),
+            (
+                {"status": "completed", "result": "death", "floor": 3, "turns": 47},
+                CompletedOutcome,
+                {"result": "death"},
+            ),
+            (
+                {"status": "abandoned", "reason": "timeout", "floor": 2, "turns": 30},
+                AbandonedOutcome,
+                {"reason": "timeout"},
+            ),
+        ],
+        ids=["in_progress", "completed_victory", "completed_death", "abandoned"],
+    )
+    def test_parse_outcome(self, data, cls, expected):
+        o = parse_outcome(data)
+        assert isinstance(o, cls)
+        for field, value in expected.items():
+            assert getattr(o, field) == value
 
 
 class TestCreateGameResponse:
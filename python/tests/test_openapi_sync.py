@@ -6,17 +6,18 @@ the API has changed and the SDK needs updating.
 
 Set OPENAPI_SPEC_URL to override the spec URL (e.g. for local development).
 Set OPENAPI_SPEC_PATH to use a local file instead of fetching.
+Either may point at a JSON rendering of the spec, which skips YAML parsing.
 """
 
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 from typing import Any, Literal, get_args, get_origin
 
 import httpx
 import pytest
-import yaml
 
 from crawlerverse.actions import (
     Attack,
@@ -88,8 +89,7 @@ def openapi_schemas() -> dict[str, Any]:
         path = Path(OPENAPI_SPEC_PATH)
         if not path.exists():
             pytest.skip(f"OpenAPI spec not found at {path}")
-        with open(path) as f:
-            spec = yaml.safe_load(f)
+        spec = _parse_spec(path.read_bytes())
         return spec["components"]["schemas"]
 
     # Otherwise fetch from URL
@@ -98,33 +98,29 @@ def openapi_schemas() -> dict[str, Any]:
         resp.raise_for_status()
     except httpx.HTTPError as exc:
         pytest.skip(f"Could not fetch OpenAPI spec from {OPENAPI_SPEC_URL}: {exc}")
-    spec = yaml.safe_load(resp.text)
+    spec = _parse_spec(resp.content)
     return spec["components"]["schemas"]
 
 
+def _parse_spec(content: bytes) -> dict[str, Any]:
+    """Parse an OpenAPI document in either its JSON or YAML form."""
+    # JSON is valid YAML, but the json module's C parser is far faster than
+    # PyYAML, so only YAML documents go through (and import) PyYAML.
+    if content.lstrip().startswith(b"{"):
+        return json.loads(content)
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it; same result, much faster.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
 def _get_schema_field_names(schema: dict[str, Any]) -> set[str]:
     """Extract field names from an OpenAPI schema."""
     props = schema.get("properties", {})
     return set(props.keys())
 
 
-def _get_model_field_aliases(model: type[CrawlerModel]) -> set[str]:
-    """Get the camelCase aliases (wire names) for a Pydantic model."""
-    aliases = set()
-    for name, field_info in model.model_fields.items():
-        alias = field_info.alias
-        if alias is not None:
-            aliases.add(alias)
-        else:
-            # If alias_generator is set, compute it
-            gen = model.model_config.get("alias_generator")
-            if gen:
-                aliases.add(gen(name))
-            else:
-                aliases.add(name)
-    return aliases
-
-
 def _is_literal_with_default(field_info: Any) -> bool:
     """Check if a field is a Literal type with a matching default.
 
@@ -144,6 +140,32 @@ def _is_literal_with_default(field_info: Any) -> bool:
     return False
 
 
+def _model_wire_fields(
+    model: type[CrawlerModel],
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Return a model's (all, required) camelCase wire names.
+
+    Required includes Literal discriminator fields with a matching default.
+    """
+    gen = model.model_config.get("alias_generator")
+    aliases = set()
+    required = set()
+    for name, field_info in model.model_fields.items():
+        alias = field_info.alias
+        if alias is None:
+            alias = gen(name) if gen else name
+        aliases.add(alias)
+        if field_info.is_required() or _is_literal_with_default(field_info):
+            required.add(alias)
+    return frozenset(aliases), frozenset(required)
+
+
+# Computed once per model and shared by both parametrized tests below.
+_MODEL_WIRE_FIELDS = {
+    model: _model_wire_fields(model) for model in SCHEMA_MODEL_MAP.values()
+}
+
+
 @pytest.mark.parametrize(
     "schema_name,model",
     list(SCHEMA_MODEL_MAP.items()),
@@ -157,7 +179,7 @@ def test_model_fields_match_openapi(
     """Each SDK model must have all fields from the OpenAPI spec."""
     schema = openapi_schemas[schema_name]
     spec_fields = _get_schema_field_names(schema)
-    model_aliases = _get_model_field_aliases(model)
+    model_aliases, _ = _MODEL_WIRE_FIELDS[model]
 
     missing = spec_fields - model_aliases
     assert not missing, (
@@ -179,17 +201,7 @@ def test_required_fields_match(
     """Required fields in OpenAPI spec must be required in SDK models."""
     schema = openapi_schemas[schema_name]
     required_in_spec = set(schema.get("required", []))
-
-    # Get model fields that are required or effectively required
-    # (Literal discriminator fields with a matching default).
-    required_in_model = set()
-    for name, field_info in model.model_fields.items():
-        alias = field_info.alias
-        if alias is None:
-            gen = model.model_config.get("alias_generator")
-            alias = gen(name) if gen else name
-        if field_info.is_required() or _is_literal_with_default(field_info):
-            required_in_model.add(alias)
+    _, required_in_model = _MODEL_WIRE_FIELDS[model]
 
     missing_required = required_in_spec - required_in_model
     assert not missing_required, (
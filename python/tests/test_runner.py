@@ -1,3 +1,5 @@
+import logging
+
 import pytest
 
 from crawlerverse.actions import Action, Move, Wait
@@ -8,7 +10,7 @@ from crawlerverse.models import (
     CompletedOutcome,
     Observation,
 )
-from crawlerverse.runner import run_game
+from crawlerverse.runner import _BACKOFF_BASE, _BACKOFF_CAP, _next_backoff, run_game
 from crawlerverse.types import Direction
 
 OBSERVATION_JSON = {
@@ -29,10 +31,13 @@ OBSERVATION_JSON = {
 }
 
 
-@pytest.fixture
-def client(monkeypatch):
-    monkeypatch.setenv("CRAWLERVERSE_API_KEY", "cra_test123")
-    with CrawlerClient(base_url="https://test.example.com/api/agent") as c:
+@pytest.fixture(scope="module")
+def client():
+    # The runner never changes client state, so one client (and its SSL
+    # context) serves every test; pytest-httpx mocks at the transport level.
+    with CrawlerClient(
+        api_key="cra_test123", base_url="https://test.example.com/api/agent"
+    ) as c:
         yield c
 
 
@@ -107,7 +112,9 @@ class TestRunGameResume:
 
 
 class TestRunGameErrorHandling:
-    def test_invalid_action_retries_with_same_observation(self, client, httpx_mock):
+    def test_invalid_action_retries_with_same_observation(
+        self, client, httpx_mock, caplog
+    ):
         call_count = 0
 
         def agent_fn(obs: Observation) -> Action:
@@ -149,8 +156,10 @@ class TestRunGameErrorHandling:
             },
         )
 
-        run_game(client, agent_fn)
+        with caplog.at_level(logging.WARNING, logger="crawlerverse"):
+            run_game(client, agent_fn)
         assert call_count == 2  # agent was called twice
+        assert '"direction":"north"' in caplog.text
 
     def test_max_invalid_actions_raises(self, client, httpx_mock):
         httpx_mock.add_response(
@@ -246,6 +255,13 @@ class TestRunGameRateLimit:
         assert isinstance(result.outcome, CompletedOutcome)
         assert result.outcome.result == "victory"
 
+    def test_backoff_jitter_grows_and_is_capped(self):
+        delay = _BACKOFF_BASE
+        for _ in range(50):
+            nxt = _next_backoff(delay)
+            assert _BACKOFF_BASE <= nxt <= min(_BACKOFF_CAP, delay * 3)
+            delay = nxt
+
 
 class TestRunGameAgentExceptions:
     def test_agent_exception_wrapped_with_context(self, client, httpx_mock):
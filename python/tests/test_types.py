@@ -11,6 +11,14 @@ def test_direction_from_string():
     assert Direction("north") is Direction.NORTH
 
 
+def test_enums_are_str_values():
+    # The models key lookup tables by these members and rely on str hashing.
+    for enum in (Direction, GameStatus, TileType):
+        for member in enum:
+            assert isinstance(member, str)
+            assert enum(member.value) is member
+
+
 def test_game_status_values():
     assert GameStatus.IN_PROGRESS == "in_progress"
     assert GameStatus.COMPLETED == "completed"